@@ -0,0 +1,186 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from requests import Response as HTTPResponse
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body along with its HTTP validators
+
+    The body is kept undecoded so every hit decodes a fresh payload and
+    callers cannot modify the cached result.
+    """
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def decode(self) -> Any:
+        """Decodes the JSON body into a new payload"""
+        return json.loads(self.body)
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API"""
+        return time.monotonic() < self.expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers used to revalidate the entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how the cache has been used"""
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    not_modified: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+
+class ResponseCache:
+    """In-memory cache of API responses with conditional revalidation"""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            ttl (float): Seconds an entry is served without revalidation.
+            max_entries (int): Maximum number of entries kept (least recently used are evicted).
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+    ) -> str:
+        """
+        Builds a stable cache key for a request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request url.
+            params (dict): The query parameters.
+            body (Any): The JSON body (if any).
+
+        Returns:
+            str: A key identifying the request.
+        """
+        return json.dumps(
+            [method.upper(), url, params or {}, body],
+            sort_keys=True,
+            default=str,
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Looks up an entry (fresh or stale) and records a hit or miss.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The entry if one is stored.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.stats.hits += 1
+            else:
+                self.stats.revalidations += 1
+            return entry
+
+    def store(self, key: str, response: HTTPResponse) -> CacheEntry:
+        """
+        Stores a freshly downloaded response body with its validators.
+
+        Args:
+            key (str): The cache key.
+            response (requests.Response): The response to store.
+
+        Returns:
+            CacheEntry: The stored entry.
+        """
+        entry = CacheEntry(
+            body=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            self.stats.bytes_downloaded += entry.size
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def refresh(self, key: str, response: HTTPResponse) -> Optional[CacheEntry]:
+        """
+        Extends a stored entry after the API answered 304 Not Modified.
+
+        Args:
+            key (str): The cache key.
+            response (requests.Response): The 304 response.
+
+        Returns:
+            Optional[CacheEntry]: The refreshed entry, or None if it was evicted.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.etag = response.headers.get("ETag", entry.etag)
+            entry.last_modified = response.headers.get(
+                "Last-Modified", entry.last_modified
+            )
+            entry.expires_at = time.monotonic() + self.ttl
+            self.stats.not_modified += 1
+            self.stats.bytes_saved += entry.size
+            return entry
+
+    def clear(self) -> None:
+        """Removes every entry (the stats are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
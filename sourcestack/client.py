@@ -1,8 +1,12 @@
 import os
+from typing import Optional
 
 from requests import Session
+from requests.adapters import BaseAdapter
 
+from sourcestack.cache import ResponseCache
 from sourcestack.jobs import Jobs
+from sourcestack.scheduler import RequestScheduler
 
 DEFAULT_BASE_URL = "https://sourcestack-api.com"
 
@@ -10,11 +14,17 @@ DEFAULT_BASE_URL = "https://sourcestack-api.com"
 class Client:
     api_key: str
     base_url: str
+    cache: Optional[ResponseCache]
+    scheduler: Optional[RequestScheduler]
+    adapter: Optional[BaseAdapter]
 
     def __init__(
         self,
         api_key: str | None = os.getenv("SOURCESTACK_API_KEY"),
         base_url: str | None = os.getenv("SOURCESTACK_BASE_URL"),
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        adapter: Optional[BaseAdapter] = None,
     ):
         """
         Initializes the client with the api key and base url.
@@ -22,11 +32,17 @@ class Client:
         Args:
             api_key (str): The api key to authenticate with the SourceStack API (required).
             base_url (str): The base url of the SourceStack API (optional).
+            cache (ResponseCache): A cache shared by resources to revalidate responses (optional).
+            scheduler (RequestScheduler): A scheduler admitting requests by priority class (optional).
+            adapter (BaseAdapter): A transport adapter shared by all sessions, e.g. an HTTP2Adapter (optional).
         """
         if not api_key:
             raise ValueError("api_key is required")
         self.api_key = api_key
         self.base_url = base_url or DEFAULT_BASE_URL
+        self.cache = cache
+        self.scheduler = scheduler
+        self.adapter = adapter
 
     @property
     def session(self) -> Session:
@@ -44,6 +60,9 @@ class Client:
                 "X-API-KEY": self.api_key,
             }
         )
+        if self.adapter is not None:
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
         return session
 
     @property
@@ -54,4 +73,9 @@ class Client:
         Returns:
             Jobs: A jobs resource used to retrieve jobs from the SourceStack API.
         """
-        return Jobs(session=self.session, base_url=self.base_url)
+        return Jobs(
+            session=self.session,
+            base_url=self.base_url,
+            cache=self.cache,
+            scheduler=self.scheduler,
+        )
@@ -1,7 +1,11 @@
-from typing import Any, Dict, List, Optional, TypedDict
+import json
+from typing import Any, Dict, List, Optional, TypedDict, Union
 from urllib.parse import urljoin
 
+from requests import Response as HTTPResponse
+
 from sourcestack.resource import Resource
+from sourcestack.tracing import span
 
 Job = Dict[str, Any]
 
@@ -12,6 +16,23 @@ Response = TypedDict(
     },
 )
 
+RAW_CHUNK_SIZE = 65536
+
+
+def job_key(job: Job) -> str:
+    """
+    Builds a stable identity for a job.
+
+    Args:
+        job (Job): A job returned by the SourceStack API.
+
+    Returns:
+        str: The job's post url, or a canonical encoding of the job if it has none.
+    """
+    if post_url := job.get("post_url"):
+        return str(post_url)
+    return json.dumps(job, sort_keys=True, default=str)
+
 
 class Jobs(Resource):
     def by_name(self, name: str, exact: bool = False, **kwargs) -> Response:
@@ -125,12 +146,103 @@ class Jobs(Resource):
         if fields := kwargs.get("fields"):
             params["fields"] = fields
 
-        response = self.session.post(url, json={"filters": filters}, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", url, params=params, body={"filters": filters})
+
+    def raw(
+        self,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        stream: Optional[Any] = None,
+        chunk_size: int = RAW_CHUNK_SIZE,
+        **kwargs,
+    ) -> Union[bytes, int]:
+        """
+        Fetches jobs without decoding the response body.
+
+        Sends a GET with the query parameters, or a POST when filters are given.
+        Raw requests bypass the response cache.
+
+        Args:
+            filters (List[Dict]): Advanced filter conditions (optional).
+            stream: A file-like object (``write``) or socket (``sendall``) the body
+                is copied into chunk by chunk instead of being buffered (optional).
+            chunk_size (int): Size of the chunks copied into the stream.
+            **kwargs: Query parameters (e.g., name, exact, limit, fields)
+
+        Returns:
+            Union[bytes, int]: The body, or the number of bytes streamed.
+        """
+        url = urljoin(self.base_url, "jobs")
+        method = "GET" if filters is None else "POST"
+        body = None if filters is None else {"filters": filters}
+        with self._slot():
+            with span("request", method=method):
+                response = self.session.request(
+                    method, url, params=kwargs, json=body, stream=stream is not None
+                )
+
+            with response, span("download"):
+                response.raise_for_status()
+                if stream is None:
+                    return response.content
+
+                write = getattr(stream, "sendall", None) or stream.write
+                written = 0
+                for chunk in response.iter_content(chunk_size):
+                    write(chunk)
+                    written += len(chunk)
+                return written
 
     def _get(self, **kwargs) -> Response:
         url = urljoin(self.base_url, "jobs")
-        response = self.session.get(url, params=kwargs)
+        return self._request("GET", url, params=kwargs)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Response:
+        if self.cache is None:
+            response = self._send(method, url, params, body)
+            response.raise_for_status()
+            with span("decode"):
+                return response.json()
+
+        key = self.cache.key(method, url, params, body)
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            with span("decode"):
+                return entry.decode()
+
+        headers = entry.validators if entry is not None else {}
+        response = self._send(method, url, params, body, headers)
+        if response.status_code == 304 and entry is not None:
+            entry = self.cache.refresh(key, response) or entry
+            with span("decode"):
+                return entry.decode()
+
         response.raise_for_status()
-        return response.json()
+        with span("decode"):
+            payload = response.json()
+        self.cache.store(key, response)
+        return payload
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HTTPResponse:
+        # Streaming splits the time until the headers arrive (connection setup
+        # and server wait) from the time spent downloading the body.
+        with self._slot():
+            with span("request", method=method):
+                response = self.session.request(
+                    method, url, params=params, json=body, headers=headers, stream=True
+                )
+            with span("download"):
+                response.content
+        return response
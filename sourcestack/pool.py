@@ -0,0 +1,271 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, List, Optional, Sequence, Union
+
+from requests import Response as HTTPResponse
+from requests import Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from sourcestack.cache import ResponseCache
+from sourcestack.client import Client
+from sourcestack.scheduler import RequestScheduler
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_THROTTLE_COOLDOWN = 60.0
+DEFAULT_UNAUTHORIZED_COOLDOWN = 900.0
+DEFAULT_MAX_WAIT = 60.0
+
+
+@dataclass
+class ApiKey:
+    """An API key with its own rate budget and usage counters
+
+    ``rate`` is the sustained number of requests per second and ``burst`` the
+    number of requests that can be sent at once; without a rate the key is
+    only limited by its connection pool.
+    """
+
+    key: str
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+    requests: int = 0
+    throttled: int = 0
+    unauthorized: int = 0
+    in_flight: int = 0
+    tokens: float = field(default=0.0, repr=False)
+    updated_at: float = field(default_factory=time.monotonic, repr=False)
+    cooldown_until: float = 0.0
+    session: Session = field(default_factory=Session, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate is not None and self.burst is None:
+            self.burst = max(self.rate, 1.0)
+        self.tokens = self.burst or 0.0
+
+    def refill(self, now: float) -> None:
+        if self.rate is not None and self.burst is not None:
+            elapsed = now - self.updated_at
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def capacity(self, now: float) -> float:
+        """Requests the key can send right now (infinite without a rate)"""
+        if now < self.cooldown_until:
+            return 0.0
+        if self.rate is None:
+            return float("inf")
+        return self.tokens
+
+    def ready_at(self, now: float) -> float:
+        """When the key can next send a request"""
+        ready = max(now, self.cooldown_until)
+        if self.rate is not None and self.tokens < 1:
+            ready = max(ready, now + (1 - self.tokens) / self.rate)
+        return ready
+
+
+def _retry_after(response: HTTPResponse) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class KeyPoolSession(Session):
+    """Session that spreads requests over several API keys
+
+    Each request goes to the key with the most remaining capacity. A key that
+    answers 401 or 429 is taken out of rotation for a cool-down and the request
+    is retried on another key.
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[Union[str, ApiKey]],
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        throttle_cooldown: float = DEFAULT_THROTTLE_COOLDOWN,
+        unauthorized_cooldown: float = DEFAULT_UNAUTHORIZED_COOLDOWN,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        adapter: Optional[BaseAdapter] = None,
+    ):
+        """
+        Initializes the session.
+
+        Args:
+            api_keys: The keys (strings use the default rate and burst).
+            rate (float): Default requests per second per key (optional).
+            burst (float): Default burst size per key (optional).
+            pool_size (int): Connections kept per key.
+            throttle_cooldown (float): Seconds a key rests after a 429 without Retry-After.
+            unauthorized_cooldown (float): Seconds a key rests after a 401.
+            max_wait (float): Longest a request waits for a key to become available.
+            adapter (BaseAdapter): A transport shared by every key instead of a pool per key (optional).
+        """
+        super().__init__()
+        if not api_keys:
+            raise ValueError("api_keys is required")
+
+        self.headers.update(
+            {"Accept": "application/json", "Content-Type": "application/json"}
+        )
+        self.keys: List[ApiKey] = [
+            key if isinstance(key, ApiKey) else ApiKey(key, rate=rate, burst=burst)
+            for key in api_keys
+        ]
+        for key in self.keys:
+            transport = adapter or HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_size
+            )
+            key.session.mount("https://", transport)
+            key.session.mount("http://", transport)
+            key.session.headers.update(self.headers)
+            key.session.headers["X-API-KEY"] = key.key
+        self.throttle_cooldown = throttle_cooldown
+        self.unauthorized_cooldown = unauthorized_cooldown
+        self.max_wait = max_wait
+        self._condition = threading.Condition()
+
+    def _acquire(self) -> ApiKey:
+        """Reserves the key with the most remaining capacity (waiting if needed)"""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                for key in self.keys:
+                    key.refill(now)
+                best = max(
+                    self.keys,
+                    key=lambda key: (key.capacity(now), -key.in_flight, -key.requests),
+                )
+                if best.capacity(now) >= 1:
+                    if best.rate is not None:
+                        best.tokens -= 1
+                    best.in_flight += 1
+                    best.requests += 1
+                    return best
+                soonest = min(self.keys, key=lambda key: key.ready_at(now))
+                wait = soonest.ready_at(now) - now
+                if wait > self.max_wait:
+                    # Every key is resting for longer than we are willing to
+                    # block, so let the soonest one surface the API error.
+                    soonest.in_flight += 1
+                    soonest.requests += 1
+                    return soonest
+                self._condition.wait(max(wait, 0.001))
+
+    def _release(self, key: ApiKey, response: Optional[HTTPResponse]) -> bool:
+        """Returns the key and reports whether the request should be retried"""
+        with self._condition:
+            key.in_flight -= 1
+            retry = False
+            if response is not None and response.status_code == 429:
+                key.throttled += 1
+                cooldown = _retry_after(response)
+                key.cooldown_until = time.monotonic() + (
+                    self.throttle_cooldown if cooldown is None else cooldown
+                )
+                retry = True
+            elif response is not None and response.status_code == 401:
+                key.unauthorized += 1
+                key.cooldown_until = time.monotonic() + self.unauthorized_cooldown
+                retry = True
+            self._condition.notify_all()
+            return retry
+
+    def request(
+        self,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        *args: Any,
+        **kwargs: Any
+    ) -> HTTPResponse:
+        attempts = 0
+        while True:
+            attempts += 1
+            key = self._acquire()
+            try:
+                response = key.session.request(method, url, *args, **kwargs)
+            except Exception:
+                self._release(key, None)
+                raise
+
+            if not self._release(key, response) or attempts >= len(self.keys):
+                return response
+            response.close()
+
+    def close(self) -> None:
+        for key in self.keys:
+            key.session.close()
+        super().close()
+
+
+class PooledClient(Client):
+    """Client that authenticates with a pool of API keys"""
+
+    def __init__(
+        self,
+        api_keys: Sequence[Union[str, ApiKey]],
+        base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        throttle_cooldown: float = DEFAULT_THROTTLE_COOLDOWN,
+        unauthorized_cooldown: float = DEFAULT_UNAUTHORIZED_COOLDOWN,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        adapter: Optional[BaseAdapter] = None,
+    ):
+        """
+        Initializes the client with a pool of api keys.
+
+        Args:
+            api_keys: The api keys (or ApiKey objects with their own rate) to use (required).
+            base_url (str): The base url of the SourceStack API (optional).
+            cache (ResponseCache): A cache shared by resources to revalidate responses (optional).
+            scheduler (RequestScheduler): A scheduler admitting requests by priority class (optional).
+            rate (float): Default requests per second per key (optional).
+            burst (float): Default burst size per key (optional).
+            pool_size (int): Connections kept per key.
+            throttle_cooldown (float): Seconds a key rests after a 429 without Retry-After.
+            unauthorized_cooldown (float): Seconds a key rests after a 401.
+            max_wait (float): Longest a request waits for a key to become available.
+            adapter (BaseAdapter): A transport shared by every key, e.g. an HTTP2Adapter (optional).
+        """
+        self.pool = KeyPoolSession(
+            api_keys,
+            rate=rate,
+            burst=burst,
+            pool_size=pool_size,
+            throttle_cooldown=throttle_cooldown,
+            unauthorized_cooldown=unauthorized_cooldown,
+            max_wait=max_wait,
+            adapter=adapter,
+        )
+        super().__init__(
+            api_key=self.pool.keys[0].key,
+            base_url=base_url,
+            cache=cache,
+            scheduler=scheduler,
+            adapter=adapter,
+        )
+
+    @property
+    def session(self) -> Session:
+        """
+        Returns the shared key pool session.
+
+        Returns:
+            KeyPoolSession: A session routing each request to an api key.
+        """
+        return self.pool
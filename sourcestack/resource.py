@@ -1,14 +1,24 @@
+from contextlib import nullcontext
+from typing import Any, ContextManager, Optional
+
 from requests import Session
 
+from sourcestack.cache import ResponseCache
+from sourcestack.scheduler import RequestScheduler
+
 
 class Resource:
     session: Session
     base_url: str
+    cache: Optional[ResponseCache]
+    scheduler: Optional[RequestScheduler]
 
     def __init__(
         self,
         session: Session,
         base_url: str,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """
         Initializes with a client and a base_url.
@@ -16,7 +26,16 @@ class Resource:
         Args:
             session (requests.Session): A session to use.
             base_url (str): The base url of the SourceStack API.
+            cache (ResponseCache): An optional cache used to revalidate responses.
+            scheduler (RequestScheduler): An optional scheduler admitting requests by priority.
 
         """
         self.session = session
         self.base_url = base_url
+        self.cache = cache
+        self.scheduler = scheduler
+
+    def _slot(self) -> ContextManager[Any]:
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot()
@@ -0,0 +1,211 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, Optional, Sequence
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+DEFAULT_MAX_IN_FLIGHT = 10
+
+_priority: ContextVar[Optional[str]] = ContextVar("sourcestack_priority", default=None)
+
+
+@dataclass
+class PriorityClass:
+    """A class of requests sharing a weight and an in-flight cap
+
+    While several classes have requests waiting, each class gets a share of
+    the dispatched requests proportional to its ``weight``.
+    """
+
+    name: str
+    weight: float = 1.0
+    max_in_flight: Optional[int] = None
+    in_flight: int = 0
+    dispatched: int = 0
+    wait_time: float = 0.0
+    virtual_time: float = field(default=0.0, repr=False)
+    queue: Deque[threading.Event] = field(default_factory=deque, repr=False)
+
+    @property
+    def waiting(self) -> int:
+        return len(self.queue)
+
+    @property
+    def available(self) -> bool:
+        return self.max_in_flight is None or self.in_flight < self.max_in_flight
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """
+    Sends the requests made in the enclosed block with a priority class.
+
+    The class is kept in a context variable, so worker threads need to run in a
+    copy of the caller's context (``contextvars.copy_context().run``).
+
+    Args:
+        name (str): The priority class (e.g. interactive or batch).
+    """
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+    """Admits API requests by priority class with weighted fair sharing
+
+    Requests wait for one of ``max_in_flight`` slots (and, with a ``rate``, a
+    token of the shared rate budget). Free slots go to the waiting class with
+    the lowest virtual time, which advances by ``1 / weight`` per request, so
+    busy classes share the budget by weight and an idle class cannot bank
+    credit. Requests within a class are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        classes: Optional[Sequence[PriorityClass]] = None,
+        default: str = INTERACTIVE,
+    ):
+        """
+        Initializes the scheduler.
+
+        By default interactive requests get four times the share of batch
+        requests, and batch requests can hold at most ``max_in_flight - 2``
+        slots (but always at least one). With three or more slots this keeps
+        two free for interactive requests. With fewer slots, interactive
+        requests may have to wait for a batch request to finish.
+
+        Args:
+            max_in_flight (int): Requests sent concurrently across all classes.
+            rate (float): Requests per second across all classes (optional).
+            burst (float): Burst size of the rate budget (optional).
+            classes: The priority classes (optional).
+            default (str): Class used when no priority is set.
+        """
+        if classes is None:
+            classes = [
+                PriorityClass(INTERACTIVE, weight=4.0),
+                PriorityClass(
+                    BATCH, weight=1.0, max_in_flight=max(1, max_in_flight - 2)
+                ),
+            ]
+        self.classes: Dict[str, PriorityClass] = {cls.name: cls for cls in classes}
+        if default not in self.classes:
+            raise ValueError(f"Unknown default priority class: {default}")
+
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate or 0.0, 1.0)
+        self.default = default
+        self.in_flight = 0
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._virtual_clock = 0.0
+        self._lock = threading.Lock()
+
+    def _class(self, name: Optional[str]) -> PriorityClass:
+        name = name or _priority.get() or self.default
+        if name not in self.classes:
+            raise ValueError(f"Unknown priority class: {name}")
+        return self.classes[name]
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.rate is not None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _retry_in(self) -> Optional[float]:
+        """How long a waiter sleeps before re-checking the rate budget"""
+        if self.rate is None:
+            return None
+        if self._tokens >= 1:
+            return 1 / self.rate
+        return max((1 - self._tokens) / self.rate, 0.001)
+
+    def _dispatch(self) -> None:
+        """Grants free slots to waiting requests (the lock must be held)"""
+        self._refill()
+        while self.in_flight < self.max_in_flight:
+            if self.rate is not None and self._tokens < 1:
+                return
+            candidates = [
+                cls for cls in self.classes.values() if cls.queue and cls.available
+            ]
+            if not candidates:
+                return
+
+            cls = min(
+                candidates,
+                key=lambda cls: (
+                    max(cls.virtual_time, self._virtual_clock),
+                    -cls.weight,
+                ),
+            )
+            start = max(cls.virtual_time, self._virtual_clock)
+            self._virtual_clock = start
+            cls.virtual_time = start + 1 / cls.weight
+
+            if self.rate is not None:
+                self._tokens -= 1
+            cls.in_flight += 1
+            cls.dispatched += 1
+            self.in_flight += 1
+            cls.queue.popleft().set()
+
+    def _release(self, cls: PriorityClass) -> None:
+        with self._lock:
+            cls.in_flight -= 1
+            self.in_flight -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None) -> Iterator[PriorityClass]:
+        """
+        Waits for a slot and holds it for the enclosed request.
+
+        Args:
+            priority (str): The priority class (defaults to the current ``priority``).
+
+        Yields:
+            PriorityClass: The class the request was admitted under.
+        """
+        cls = self._class(priority)
+        ticket = threading.Event()
+        queued_at = time.monotonic()
+        with self._lock:
+            cls.queue.append(ticket)
+            self._dispatch()
+            retry_in = self._retry_in()
+
+        try:
+            while not ticket.wait(retry_in):
+                with self._lock:
+                    self._dispatch()
+                    retry_in = self._retry_in()
+        except BaseException:
+            with self._lock:
+                granted = ticket not in cls.queue
+                if not granted:
+                    cls.queue.remove(ticket)
+            if granted:
+                self._release(cls)
+            raise
+
+        with self._lock:
+            cls.wait_time += time.monotonic() - queued_at
+        try:
+            yield cls
+        finally:
+            self._release(cls)
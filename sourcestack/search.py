@@ -1,10 +1,14 @@
 import os
 from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from sourcestack.cache import ResponseCache
 from sourcestack.client import Client
 from sourcestack.exceptions import SearchError
+from sourcestack.jobs import Jobs
+from sourcestack.sharding import DEFAULT_MAX_SHARDS, dimensions_for, search_sharded
+from sourcestack.tracing import SlowQueryLog, span, traced
 
 
 class SourceStackSearchService:
@@ -18,13 +22,35 @@ class SourceStackSearchService:
         "uses_category",
     }
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    # Default for "exact" on the search parameters that support it
+    EXACT_DEFAULTS = {
+        "name": False,
+        "uses_product": True,
+        "uses_category": True,
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+        client: Optional[Client] = None,
+    ):
         """Initialize the search service
 
         Args:
             api_key: Optional API key (defaults to SOURCESTACK_API_KEY env var)
             base_url: Optional base URL (defaults to SOURCESTACK_BASE_URL env var)
+            cache: Optional response cache used to revalidate repeated queries
+                (used by this service only, the ``client`` is left unchanged)
+            slow_query_log: Optional log of calls exceeding a duration threshold
+            client: Optional preconfigured client (e.g. a PooledClient) to search with
         """
+        if client is not None:
+            api_key = api_key or client.api_key
+            base_url = base_url or client.base_url
+
         self.api_key = api_key or os.getenv("SOURCESTACK_API_KEY")
         self.base_url = base_url or os.getenv("SOURCESTACK_BASE_URL")
 
@@ -33,7 +59,19 @@ class SourceStackSearchService:
                 "No API key provided and SOURCESTACK_API_KEY environment variable not set"
             )
 
-        self.client = Client(api_key=self.api_key, base_url=self.base_url)
+        self.cache = cache
+        self.slow_query_log = slow_query_log
+        self.client = client or Client(
+            api_key=self.api_key, base_url=self.base_url, cache=cache
+        )
+
+    @property
+    def _jobs(self) -> Jobs:
+        """The client's jobs resource, using this service's cache if one is set"""
+        jobs = self.client.jobs
+        if self.cache is not None:
+            jobs.cache = self.cache
+        return jobs
 
     def _validate_search_params(self, params: Dict[str, Any]) -> None:
         """Validate search parameters"""
@@ -57,6 +95,51 @@ class SourceStackSearchService:
                     f"Filter must contain all required keys: {required_keys}"
                 )
 
+    def _validate_advanced_params(self, kwargs: Dict[str, Any]) -> None:
+        """Validate advanced search filters and fields"""
+        # Check if filters exist in kwargs
+        filters = kwargs.get("filters", [])
+        if not isinstance(filters, list):
+            raise SearchError("Filters must be provided as a list of filter conditions")
+
+        if not filters:
+            raise SearchError("At least one filter condition must be provided")
+
+        # Validate each filter
+        valid_operators = {
+            # Basic comparison operators
+            "EQUALS",
+            "NOT_EQUALS",
+            "GREATER_THAN",
+            "LESS_THAN",
+            # List operators
+            "IN",
+            "NOT_IN",
+            # Content matching operators
+            "CONTAINS_ANY",
+            "NOT_CONTAINS_ANY",
+            "CONTAINS_ALL",
+            "NOT_CONTAINS_ALL",
+        }
+
+        for filter_condition in filters:
+            # Validate required parameters for each filter
+            required_params = {"field", "operator", "value"}
+            if not all(param in filter_condition for param in required_params):
+                raise SearchError(
+                    f"Each filter must contain all required parameters: {required_params}"
+                )
+
+            # Validate operator for each filter
+            if filter_condition["operator"] not in valid_operators:
+                raise SearchError(
+                    f"Invalid operator. Must be one of: {valid_operators}"
+                )
+
+        if fields := kwargs.get("fields"):
+            if not isinstance(fields, str):
+                raise SearchError("Fields parameter must be a comma-separated string")
+
     def _process_url(self, url: str) -> str:
         """Process URL by removing common prefixes"""
         url = url.replace("https://", "").replace("http://", "")
@@ -123,41 +206,45 @@ class SourceStackSearchService:
         Returns:
             Dict containing search results and metadata
         """
-        try:
-            self._validate_search_params(kwargs)
-
-            # Process URL if provided
-            if url := kwargs.get("url"):
-                kwargs["url"] = self._process_url(url)
-
-            # Determine which search method to use and execute
-            if "name" in kwargs:
-                exact = kwargs.pop("exact", False)
-                results = self.client.jobs.by_name(
-                    kwargs.pop("name"), exact=exact, **kwargs
-                )
-            elif "url" in kwargs:
-                results = self.client.jobs.by_url(kwargs.pop("url"), **kwargs)
-            elif "parent" in kwargs:
-                results = self.client.jobs.by_parent(kwargs.pop("parent"), **kwargs)
-            elif "uses_product" in kwargs:
-                exact = kwargs.pop("exact", True)
-                results = self.client.jobs.by_uses_product(
-                    kwargs.pop("uses_product"), exact=exact, **kwargs
-                )
-            elif "uses_category" in kwargs:
-                exact = kwargs.pop("exact", True)
-                results = self.client.jobs.by_uses_category(
-                    kwargs.pop("uses_category"), exact=exact, **kwargs
-                )
+        with traced("search_jobs", kwargs, self.slow_query_log):
+            try:
+                with span("validate"):
+                    self._validate_search_params(kwargs)
+
+                # Process URL if provided
+                if url := kwargs.get("url"):
+                    with span("process_url"):
+                        kwargs["url"] = self._process_url(url)
+
+                # Determine which search method to use and execute
+                if "name" in kwargs:
+                    exact = kwargs.pop("exact", False)
+                    results = self._jobs.by_name(
+                        kwargs.pop("name"), exact=exact, **kwargs
+                    )
+                elif "url" in kwargs:
+                    results = self._jobs.by_url(kwargs.pop("url"), **kwargs)
+                elif "parent" in kwargs:
+                    results = self._jobs.by_parent(kwargs.pop("parent"), **kwargs)
+                elif "uses_product" in kwargs:
+                    exact = kwargs.pop("exact", True)
+                    results = self._jobs.by_uses_product(
+                        kwargs.pop("uses_product"), exact=exact, **kwargs
+                    )
+                elif "uses_category" in kwargs:
+                    exact = kwargs.pop("exact", True)
+                    results = self._jobs.by_uses_category(
+                        kwargs.pop("uses_category"), exact=exact, **kwargs
+                    )
 
-            # Format results with statistics
-            response = self._format_results(results["data"])
+                # Format results with statistics
+                with span("format"):
+                    response = self._format_results(results["data"])
 
-            return response
+                return response
 
-        except Exception as e:
-            raise SearchError(f"Search failed: {str(e)}") from e
+            except Exception as e:
+                raise SearchError(f"Search failed: {str(e)}") from e
 
     def search_jobs_advanced(self, **kwargs) -> Dict[str, Any]:
         """Search for jobs using advanced filtering
@@ -175,6 +262,11 @@ class SourceStackSearchService:
             fields (str): Comma-separated list of fields to return (e.g. 'post_url,job_name,tags_matched')
             limit (int, optional): Maximum number of results to return
             preview (str): Number of entries to preview
+            shard (bool or List[ShardDimension], optional): Split the search while
+                results are truncated, i.e. hit the limit or fall short of the
+                entry_count total the API reports (limit then applies per shard).
+                True derives the dimensions from IN and datetime filters.
+            max_shards (int, optional): Maximum number of shard requests
 
         Returns:
             Dict containing search results and metadata
@@ -182,66 +274,139 @@ class SourceStackSearchService:
         Raises:
             SearchError: If the search fails or filter validation fails
         """
-        try:
-            # Check if filters exist in kwargs
-            filters = kwargs.get("filters", [])
-            if not isinstance(filters, list):
-                raise SearchError(
-                    "Filters must be provided as a list of filter conditions"
-                )
+        with traced("search_jobs_advanced", kwargs, self.slow_query_log):
+            try:
+                with span("validate"):
+                    self._validate_advanced_params(kwargs)
+
+                if kwargs.get("shard"):
+                    return self._search_sharded(kwargs)
+
+                # Execute search via client with all filters
+                search_params = {
+                    "filters": kwargs["filters"],
+                    "limit": kwargs.get("limit"),
+                    "fields": kwargs.get("fields"),
+                }
+                results = self._jobs.search_advanced(**search_params)
+
+                # Format results with statistics
+                with span("format"):
+                    response = self._format_results(results["data"])
+
+                return response
+
+            except Exception as e:
+                raise SearchError(f"Advanced search failed: {str(e)}") from e
+
+    def _search_sharded(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run an advanced search split into shards that each fit the limit"""
+        limit = kwargs.get("limit")
+        if not limit:
+            raise SearchError("Sharded search requires a limit")
+
+        shard = kwargs["shard"]
+        filters = kwargs["filters"]
+        dimensions = dimensions_for(filters) if shard is True else list(shard)
+
+        # Shards are merged by job identity, so make sure it is returned
+        fields = kwargs.get("fields")
+        requested = [name.strip() for name in fields.split(",")] if fields else None
+        if requested and "post_url" not in requested:
+            fields = f"{fields},post_url"
+
+        def fetch(
+            shard_filters: List[Dict[str, Any]],
+        ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            results = self._jobs.search_advanced(
+                filters=shard_filters, limit=limit, fields=fields
+            )
+            total = results.get("entry_count")
+            return results["data"], total if isinstance(total, int) else None
+
+        result = search_sharded(
+            fetch,
+            filters,
+            limit=int(limit),
+            dimensions=dimensions,
+            max_shards=kwargs.get("max_shards", DEFAULT_MAX_SHARDS),
+        )
+        entries = result.entries
+        if requested and "post_url" not in requested:
+            entries = [
+                {key: value for key, value in job.items() if key in requested}
+                for job in entries
+            ]
+
+        with span("format"):
+            response = self._format_results(entries)
+        response["shards"] = result.shards
+        response["truncated"] = result.truncated
+        return response
 
-            if not filters:
-                raise SearchError("At least one filter condition must be provided")
-
-            # Validate each filter
-            valid_operators = {
-                # Basic comparison operators
-                "EQUALS",
-                "NOT_EQUALS",
-                "GREATER_THAN",
-                "LESS_THAN",
-                # List operators
-                "IN",
-                "NOT_IN",
-                # Content matching operators
-                "CONTAINS_ANY",
-                "NOT_CONTAINS_ANY",
-                "CONTAINS_ALL",
-                "NOT_CONTAINS_ALL",
-            }
+    def search_jobs_raw(
+        self, stream: Optional[Any] = None, **kwargs
+    ) -> Union[bytes, int]:
+        """Search for jobs and return the undecoded response body
 
-            for filter_condition in filters:
-                # Validate required parameters for each filter
-                required_params = {"field", "operator", "value"}
-                if not all(param in filter_condition for param in required_params):
-                    raise SearchError(
-                        f"Each filter must contain all required parameters: {required_params}"
-                    )
+        Takes the same search parameters as search_jobs, but skips JSON decoding
+        and result formatting so the body can be passed straight through.
 
-                # Validate operator for each filter
-                if filter_condition["operator"] not in valid_operators:
-                    raise SearchError(
-                        f"Invalid operator. Must be one of: {valid_operators}"
-                    )
+        Args:
+            stream: Optional file-like object or socket the body is streamed into
+            **kwargs: Search parameters (see search_jobs)
 
-            if fields := kwargs.get("fields"):
-                if not isinstance(fields, str):
-                    raise SearchError(
-                        "Fields parameter must be a comma-separated string"
-                    )
+        Returns:
+            The raw JSON body as bytes, or the number of bytes streamed
 
-            # Execute search via client with all filters
-            search_params = {
-                "filters": filters,
-                "limit": kwargs.get("limit"),
-                "fields": kwargs.get("fields"),
-            }
-            results = self.client.jobs.search_advanced(**search_params)
+        Raises:
+            SearchError: If validation or the request fails
+        """
+        with traced("search_jobs_raw", kwargs, self.slow_query_log):
+            try:
+                with span("validate"):
+                    self._validate_search_params(kwargs)
+
+                if url := kwargs.get("url"):
+                    with span("process_url"):
+                        kwargs["url"] = self._process_url(url)
+
+                for param, default in self.EXACT_DEFAULTS.items():
+                    if param in kwargs:
+                        exact = kwargs.get("exact", default)
+                        kwargs["exact"] = "true" if exact else "false"
+
+                return self._jobs.raw(stream=stream, **kwargs)
+
+            except Exception as e:
+                raise SearchError(f"Search failed: {str(e)}") from e
+
+    def search_jobs_advanced_raw(
+        self, stream: Optional[Any] = None, **kwargs
+    ) -> Union[bytes, int]:
+        """Search for jobs using advanced filtering and return the undecoded body
 
-            # Format results with statistics
-            response = self._format_results(results["data"])
+        Args:
+            stream: Optional file-like object or socket the body is streamed into
+            **kwargs: Advanced search parameters (see search_jobs_advanced)
+
+        Returns:
+            The raw JSON body as bytes, or the number of bytes streamed
 
-            return response
+        Raises:
+            SearchError: If validation or the request fails
+        """
+        with traced("search_jobs_advanced_raw", kwargs, self.slow_query_log):
+            try:
+                with span("validate"):
+                    self._validate_advanced_params(kwargs)
+
+                params = {
+                    key: kwargs[key] for key in ("limit", "fields") if kwargs.get(key)
+                }
+                return self._jobs.raw(
+                    filters=kwargs["filters"], stream=stream, **params
+                )
 
-        except Exception as e:
-            raise SearchError(f"Advanced search failed: {str(e)}") from e
+            except Exception as e:
+                raise SearchError(f"Advanced search failed: {str(e)}") from e
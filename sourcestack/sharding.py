@@ -0,0 +1,296 @@
+import contextvars
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sourcestack.jobs import Job, job_key
+
+Filter = Dict[str, Any]
+
+DEFAULT_MAX_SHARDS = 64
+DEFAULT_MAX_WORKERS = 8
+
+# Adjacent datetime shards overlap slightly so jobs on a split point are not
+# lost to the exclusive GREATER_THAN / LESS_THAN bounds (duplicates are merged).
+SHARD_OVERLAP = timedelta(seconds=1)
+
+RELATIVE_DATE = re.compile(r"^LAST_(\d+)([DHM])$")
+RELATIVE_UNITS = {"D": "days", "H": "hours", "M": "minutes"}
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parses an advanced-search datetime value.
+
+    Args:
+        value: An ISO 8601 string, a relative value such as ``LAST_7D`` or a datetime.
+
+    Returns:
+        Optional[datetime]: The timezone-aware datetime, or None if the value is not a date.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif match := RELATIVE_DATE.match(str(value).upper()):
+        delta = timedelta(**{RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+        return datetime.now(timezone.utc) - delta
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _items(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+class ShardDimension(ABC):
+    """A way of splitting an advanced search into narrower searches"""
+
+    field: str
+
+    @abstractmethod
+    def split(self, filters: List[Filter]) -> Optional[List[List[Filter]]]:
+        """
+        Splits the filters into two narrower sets.
+
+        Args:
+            filters: The filters of a search that hit the limit.
+
+        Returns:
+            Optional[List[List[Filter]]]: The filters of each shard, or None if
+            the search cannot be split any further along this dimension.
+        """
+
+
+class InListDimension(ShardDimension):
+    """Partitions the values of an ``IN`` filter"""
+
+    def __init__(self, field: str, values: Optional[Sequence[str]] = None):
+        """
+        Initializes the dimension.
+
+        Args:
+            field (str): The field to partition on.
+            values: Values to partition when the search has no IN filter on the field.
+        """
+        self.field = field
+        self.values = list(values) if values is not None else None
+
+    def split(self, filters: List[Filter]) -> Optional[List[List[Filter]]]:
+        current = next(
+            (
+                condition
+                for condition in filters
+                if condition["field"] == self.field and condition["operator"] == "IN"
+            ),
+            None,
+        )
+        if current is not None:
+            values = _items(current["value"])
+            as_list = isinstance(current["value"], list)
+        elif self.values is not None:
+            values, as_list = self.values, False
+        else:
+            return None
+        if len(values) < 2:
+            return None
+
+        rest = [condition for condition in filters if condition is not current]
+        half = len(values) // 2
+        return [
+            rest
+            + [
+                {
+                    "field": self.field,
+                    "operator": "IN",
+                    "value": part if as_list else ",".join(part),
+                }
+            ]
+            for part in (values[:half], values[half:])
+        ]
+
+
+class DateRangeDimension(ShardDimension):
+    """Bisects a datetime range expressed with GREATER_THAN / LESS_THAN"""
+
+    def __init__(
+        self,
+        field: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        min_span: timedelta = timedelta(minutes=1),
+    ):
+        """
+        Initializes the dimension.
+
+        Args:
+            field (str): The datetime field to split on (e.g. last_indexed).
+            start (datetime): Range start when the search has no GREATER_THAN bound.
+            end (datetime): Range end when the search has no LESS_THAN bound (defaults to now).
+            min_span (timedelta): Ranges this short are not split any further.
+        """
+        self.field = field
+        self.start = parse_datetime(start) if start is not None else None
+        self.end = parse_datetime(end) if end is not None else None
+        self.min_span = min_span
+
+    def _bound(self, filters: List[Filter], operator: str) -> Optional[datetime]:
+        for condition in filters:
+            if condition["field"] == self.field and condition["operator"] == operator:
+                return parse_datetime(condition["value"])
+        return None
+
+    def split(self, filters: List[Filter]) -> Optional[List[List[Filter]]]:
+        start = self._bound(filters, "GREATER_THAN") or self.start
+        end = (
+            self._bound(filters, "LESS_THAN") or self.end or datetime.now(timezone.utc)
+        )
+        if start is None or end - start <= self.min_span:
+            return None
+
+        middle = start + (end - start) / 2
+        rest = [
+            condition
+            for condition in filters
+            if not (
+                condition["field"] == self.field
+                and condition["operator"] in ("GREATER_THAN", "LESS_THAN")
+            )
+        ]
+        return [
+            rest + self._range(start, middle + SHARD_OVERLAP),
+            rest + self._range(middle - SHARD_OVERLAP, end),
+        ]
+
+    def _range(self, start: datetime, end: datetime) -> List[Filter]:
+        return [
+            {
+                "field": self.field,
+                "operator": "GREATER_THAN",
+                "value": start.isoformat(),
+            },
+            {"field": self.field, "operator": "LESS_THAN", "value": end.isoformat()},
+        ]
+
+
+def dimensions_for(filters: List[Filter]) -> List[ShardDimension]:
+    """
+    Derives shard dimensions from the filters of a search.
+
+    ``IN`` filters with several values are partitioned first, then datetime
+    ranges (GREATER_THAN with an ISO or ``LAST_*`` string value) are bisected.
+    Non-string values are left alone, so numeric fields are never treated as
+    dates.
+
+    Args:
+        filters: The advanced search filters.
+
+    Returns:
+        List[ShardDimension]: The dimensions, in the order they are tried.
+    """
+    dimensions: List[ShardDimension] = []
+    for condition in filters:
+        if condition["operator"] == "IN" and len(_items(condition["value"])) > 1:
+            dimensions.append(InListDimension(condition["field"]))
+    for condition in filters:
+        value = condition["value"]
+        if (
+            condition["operator"] == "GREATER_THAN"
+            and isinstance(value, str)
+            and parse_datetime(value)
+        ):
+            dimensions.append(DateRangeDimension(condition["field"]))
+    return dimensions
+
+
+@dataclass
+class ShardedResult:
+    """Merged results of a sharded search"""
+
+    entries: List[Job]
+    shards: int
+    truncated: bool
+
+
+def search_sharded(
+    fetch: Callable[[List[Filter]], Tuple[List[Job], Optional[int]]],
+    filters: List[Filter],
+    limit: int,
+    dimensions: Sequence[ShardDimension],
+    max_shards: int = DEFAULT_MAX_SHARDS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> ShardedResult:
+    """
+    Runs a search, splitting it while any shard comes back full.
+
+    Shards are fetched level by level in parallel. A shard is full, and is
+    split along the first dimension that can split it, when it returns
+    ``limit`` jobs or when the API reports more matches than it returned
+    (which catches responses cut off by a server-side cap below ``limit``).
+    Results are merged and deduplicated by job identity.
+
+    Args:
+        fetch: Runs one search for the given filters and returns its jobs and
+            the total number of matches reported by the API (None if unknown).
+        filters: The filters of the original search.
+        limit (int): The per-request result limit.
+        dimensions: The dimensions used to split full shards.
+        max_shards (int): Upper bound on the number of requests made.
+        max_workers (int): Number of shards fetched concurrently.
+
+    Returns:
+        ShardedResult: The merged jobs, the number of shards fetched and whether
+        any shard was still full when it could not be split further.
+    """
+    merged: Dict[str, Job] = {}
+    frontier = [filters]
+    shards = 0
+    truncated = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while frontier:
+            # Run each shard in a copy of the caller's context so tracing
+            # spans and the request priority carry over to the workers.
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch, shard)
+                for shard in frontier
+            ]
+            shards += len(frontier)
+
+            next_frontier: List[List[Filter]] = []
+            for shard, future in zip(frontier, futures):
+                entries, total = future.result()
+                children = None
+                if len(entries) >= limit or (
+                    total is not None and total > len(entries)
+                ):
+                    children = next(
+                        (
+                            split
+                            for dimension in dimensions
+                            if (split := dimension.split(shard)) is not None
+                        ),
+                        None,
+                    )
+                    budget = max_shards - shards - len(next_frontier)
+                    if children is None or len(children) > budget:
+                        children = None
+                        truncated = True
+
+                if children is None:
+                    for job in entries:
+                        merged.setdefault(job_key(job), job)
+                else:
+                    next_frontier.extend(children)
+            frontier = next_frontier
+
+    return ShardedResult(
+        entries=list(merged.values()), shards=shards, truncated=truncated
+    )
@@ -0,0 +1,730 @@
+"""Local stand-in for the SourceStack API used for load and performance testing.
+
+The simulator serves ``/jobs`` over real HTTP on localhost so that ``Client`` can
+be exercised end to end (sockets, JSON encoding and decoding, retries) without
+talking to the real API::
+
+    with SourceStackSimulator(job_count=5000, latency=uniform(0.01, 0.05)) as sim:
+        client = Client(api_key="fake-api-key", base_url=sim.url)
+        client.jobs.by_name("Engineer")
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import socket
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import h2.config  # type: ignore[import-not-found]
+    import h2.connection  # type: ignore[import-not-found]
+    import h2.events  # type: ignore[import-not-found]
+    import h2.exceptions  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None  # type: ignore[assignment]
+
+Job = Dict[str, Any]
+Latency = Union[float, Callable[[], float], None]
+
+DEFAULT_LIMIT = 100
+
+COMPANIES = [
+    ("Spotify", "spotify.com"),
+    ("Canva", "canva.com"),
+    ("Shopify", "shopify.com"),
+    ("Atlassian", "atlassian.com"),
+    ("Stripe", "stripe.com"),
+    ("Datadog", "datadoghq.com"),
+    ("GitLab", "gitlab.com"),
+    ("Zalando", "zalando.com"),
+    ("Twilio", "twilio.com"),
+    ("Elastic", "elastic.co"),
+]
+TITLES = [
+    "Platform Engineer",
+    "DevOps Engineer",
+    "Senior Software Engineer",
+    "Site Reliability Engineer",
+    "Data Engineer",
+    "Backend Developer",
+    "Frontend Developer",
+    "Engineering Manager",
+    "Product Manager",
+    "Security Engineer",
+]
+DEPARTMENTS = ["Engineering", "Product", "Data", "Security", "Operations"]
+COUNTRIES = [
+    "United States",
+    "United Kingdom",
+    "Germany",
+    "Canada",
+    "Australia",
+    "Sweden",
+]
+PRODUCTS = {
+    "Docker": "Containers",
+    "Kubernetes": "Container Orchestration",
+    "Nomad": "Container Orchestration",
+    "AWS": "Cloud Providers",
+    "GCP": "Cloud Providers",
+    "Terraform": "Infrastructure as Code",
+    "Python": "Programming Languages",
+    "Go": "Programming Languages",
+    "PostgreSQL": "Databases",
+    "Kafka": "Message Queues",
+}
+
+RELATIVE_DATE = re.compile(r"^LAST_(\d+)([DHM])$")
+
+
+def fixed(seconds: float) -> Callable[[], float]:
+    """Latency distribution that always waits the same time"""
+    return lambda: seconds
+
+
+def uniform(low: float, high: float, seed: Optional[int] = None) -> Callable[[], float]:
+    """Latency distribution drawn uniformly between low and high seconds"""
+    rng = random.Random(seed)
+    return lambda: rng.uniform(low, high)
+
+
+def lognormal(
+    median: float, sigma: float = 0.5, seed: Optional[int] = None
+) -> Callable[[], float]:
+    """Long-tailed latency distribution around a median in seconds"""
+    rng = random.Random(seed)
+    if median <= 0:
+        return lambda: 0.0
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+def generate_jobs(count: int, seed: int = 0) -> List[Job]:
+    """
+    Generates realistic synthetic job postings.
+
+    Args:
+        count (int): The number of jobs to generate.
+        seed (int): Seed for the random generator so runs are reproducible.
+
+    Returns:
+        List[Job]: The generated jobs.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    products = list(PRODUCTS)
+    jobs = []
+    for index in range(count):
+        company_name, domain = rng.choice(COMPANIES)
+        tags = rng.sample(products, rng.randint(1, 4))
+        jobs.append(
+            {
+                "job_name": rng.choice(TITLES),
+                "company_name": company_name,
+                "company_url": domain,
+                "post_url": f"https://{domain}/careers/{index}",
+                "department": rng.choice(DEPARTMENTS),
+                "country": rng.choice(COUNTRIES),
+                "remote": rng.random() < 0.4,
+                "hours": rng.choice([20, 30, 40]),
+                "tags_matched": tags,
+                "tag_categories": sorted({PRODUCTS[tag] for tag in tags}),
+                "last_indexed": (
+                    now - timedelta(minutes=rng.randint(0, 60 * 24 * 60))
+                ).isoformat(),
+            }
+        )
+    return jobs
+
+
+def _terms(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [str(item).lower() for item in value]
+    return [term for term in re.split(r"[\s,]+", str(value).lower()) if term]
+
+
+def _items(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [str(item).lower() for item in value]
+    return [item.strip().lower() for item in str(value).split(",")]
+
+
+def _comparable(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    text = str(value)
+    if match := RELATIVE_DATE.match(text.upper()):
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {"D": timedelta(days=amount), "H": timedelta(hours=amount)}.get(
+            unit, timedelta(minutes=amount)
+        )
+        return datetime.now(timezone.utc) - delta
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return text.lower()
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _equals(actual: Any, expected: Any) -> bool:
+    if isinstance(actual, bool):
+        return actual == (str(expected).lower() in ("true", "1"))
+    if isinstance(actual, list):
+        return sorted(_items(actual)) == sorted(_items(expected))
+    return str(actual).lower() == str(expected).lower()
+
+
+def matches_filter(job: Job, condition: Dict[str, Any]) -> bool:
+    """
+    Evaluates one advanced-search filter condition against a job.
+
+    Args:
+        job (Job): The job to test.
+        condition (dict): A filter with ``field``, ``operator`` and ``value``.
+
+    Returns:
+        bool: Whether the job satisfies the condition.
+    """
+    actual = job.get(condition["field"])
+    operator = condition["operator"]
+    value = condition["value"]
+    if actual is None:
+        return operator.startswith("NOT_")
+
+    if operator in ("EQUALS", "NOT_EQUALS"):
+        return _equals(actual, value) == (operator == "EQUALS")
+    if operator in ("IN", "NOT_IN"):
+        found = str(actual).lower() in _items(value)
+        return found == (operator == "IN")
+    if operator in ("GREATER_THAN", "LESS_THAN"):
+        left, right = _comparable(actual), _comparable(value)
+        try:
+            return left > right if operator == "GREATER_THAN" else left < right
+        except TypeError:
+            return False
+
+    terms = _terms(value)
+    if isinstance(actual, list):
+        haystack = [str(item).lower() for item in actual]
+        hits = [term in haystack for term in terms]
+    else:
+        text = str(actual).lower()
+        hits = [term in text for term in terms]
+    if operator in ("CONTAINS_ANY", "NOT_CONTAINS_ANY"):
+        return any(hits) == (operator == "CONTAINS_ANY")
+    if operator in ("CONTAINS_ALL", "NOT_CONTAINS_ALL"):
+        return all(hits) == (operator == "CONTAINS_ALL")
+    raise ValueError(f"Invalid operator: {operator}")
+
+
+def _contains(actual: Any, value: str, exact: bool) -> bool:
+    needle = value.lower()
+    if isinstance(actual, list):
+        items = [str(item).lower() for item in actual]
+        return needle in items if exact else any(needle in item for item in items)
+    text = str(actual or "").lower()
+    return text == needle if exact else needle in text
+
+
+class SimulatorStats:
+    """Request counters collected by the simulator"""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self.statuses: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def connect(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def enter(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self, status: int) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.statuses[status] += 1
+
+
+class SourceStackSimulator:
+    """Threaded HTTP server that imitates the SourceStack ``/jobs`` endpoint"""
+
+    def __init__(
+        self,
+        job_count: int = 1000,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_key: Optional[str] = None,
+        latency: Latency = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        chunk_size: int = 16384,
+        chunk_delay: float = 0.0,
+        default_limit: int = DEFAULT_LIMIT,
+        max_limit: Optional[int] = None,
+        http2: bool = False,
+    ):
+        """
+        Initializes the simulator.
+
+        Args:
+            job_count (int): Number of synthetic jobs served.
+            seed (int): Seed used for job generation and fault injection.
+            host (str): Interface to bind to.
+            port (int): Port to bind to (0 picks a free port).
+            api_key (str): If set, requests without a matching X-API-KEY get a 401.
+            latency: Seconds (or a callable returning seconds) to wait before answering.
+            error_rate (float): Fraction of requests answered with a 503.
+            throttle_rate (float): Fraction of requests answered with a 429.
+            retry_after (int): Retry-After value sent with 429 responses.
+            chunk_size (int): Size of the body chunks written to the socket.
+            chunk_delay (float): Seconds to wait between body chunks (slow bodies).
+            default_limit (int): Result limit applied when a request sets none.
+            max_limit (int): Cap applied to requested limits (optional).
+            http2 (bool): Serve cleartext HTTP/2 (prior knowledge) instead of HTTP/1.1.
+        """
+        self.jobs = generate_jobs(job_count, seed=seed)
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+        self.http2 = http2
+        self.stats = SimulatorStats()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._scripted: Deque[int] = deque()
+        self._server: Optional[Union[ThreadingHTTPServer, _H2Server]] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base url to hand to ``Client``"""
+        if self._server is None:
+            raise RuntimeError("Simulator is not running")
+        return f"http://{self.host}:{self._server.server_port}"
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """
+        Answers the next requests with the given status code.
+
+        Args:
+            status (int): The HTTP status to send (e.g. 429 or 500).
+            count (int): How many requests to fail.
+        """
+        with self._rng_lock:
+            self._scripted.extend([status] * count)
+
+    def start(self) -> "SourceStackSimulator":
+        """Starts serving in a background thread"""
+        if self.http2:
+            self._server = _H2Server(self, self.host, self.port)
+        else:
+            handler = type("Handler", (_Handler,), {"simulator": self})
+            self._server = ThreadingHTTPServer((self.host, self.port), handler)
+            self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="sourcestack-simulator"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and waits for the background thread"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SourceStackSimulator":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def search(self, params: Dict[str, str]) -> List[Job]:
+        """Evaluates a basic ``GET /jobs`` query"""
+        exact = params.get("exact", "false").lower() == "true"
+        if "name" in params:
+            field, value = "job_name", params["name"]
+        elif "parent" in params:
+            field, value, exact = "company_name", params["parent"], False
+        elif "url" in params:
+            field, value, exact = "company_url", params["url"], False
+        elif "uses_product" in params:
+            field, value = "tags_matched", params["uses_product"]
+        elif "uses_category" in params:
+            field, value = "tag_categories", params["uses_category"]
+        else:
+            return list(self.jobs)
+        return [job for job in self.jobs if _contains(job.get(field), value, exact)]
+
+    def search_advanced(self, filters: List[Dict[str, Any]]) -> List[Job]:
+        """Evaluates an advanced ``POST /jobs`` query"""
+        return [
+            job
+            for job in self.jobs
+            if all(matches_filter(job, condition) for condition in filters)
+        ]
+
+    def fault(self) -> Optional[int]:
+        """Picks the injected status for the current request (if any)"""
+        with self._rng_lock:
+            if self._scripted:
+                return self._scripted.popleft()
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 503
+        return None
+
+    def delay(self) -> None:
+        """Sleeps for the configured latency"""
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+
+    def chunks(self, body: bytes) -> Iterator[bytes]:
+        """Splits a response body into chunks, pausing between them"""
+        for start in range(0, len(body), self.chunk_size):
+            if start and self.chunk_delay:
+                time.sleep(self.chunk_delay)
+            yield body[start : start + self.chunk_size]
+
+    def respond(
+        self, method: str, target: str, headers: Mapping[str, str], body: bytes
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Answers one request independently of the HTTP version it came in on.
+
+        Args:
+            method (str): The request method.
+            target (str): The request path and query string.
+            headers: The request headers.
+            body (bytes): The request body.
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes]: The status, headers and body.
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        parsed = urlparse(target)
+        if parsed.path.rstrip("/") != "/jobs" or method not in ("GET", "POST"):
+            return self._json(404, {"error": "Not found"})
+
+        self.delay()
+        if self.api_key and headers.get("x-api-key") != self.api_key:
+            return self._json(401, {"error": "Invalid API key"})
+        if injected := self.fault():
+            return self._json(injected, {"error": "Injected failure"})
+
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        try:
+            if method == "POST":
+                results = self.search_advanced(json.loads(body or b"{}")["filters"])
+            else:
+                results = self.search(params)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            return self._json(400, {"error": str(e)})
+
+        # entry_count reports every match, not just the returned page
+        total = len(results)
+        limit = int(params.get("limit") or self.default_limit)
+        if self.max_limit is not None:
+            limit = min(limit, self.max_limit)
+        results = results[:limit]
+        if fields := params.get("fields"):
+            names = [name.strip() for name in fields.split(",")]
+            results = [
+                {name: job[name] for name in names if name in job} for job in results
+            ]
+        return self._json(
+            200,
+            {"entry_count": total, "data": results},
+            if_none_match=headers.get("if-none-match"),
+        )
+
+    def _json(
+        self, status: int, payload: Any, if_none_match: Optional[str] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        body = json.dumps(payload).encode()
+        headers = {"Content-Type": "application/json"}
+        if status == 200:
+            headers["ETag"] = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if if_none_match == headers["ETag"]:
+                return 304, {"ETag": headers["ETag"], "Content-Length": "0"}, b""
+        if status == 429:
+            headers["Retry-After"] = str(self.retry_after)
+        headers["Content-Length"] = str(len(body))
+        return status, headers, body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    simulator: SourceStackSimulator
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def setup(self) -> None:
+        super().setup()
+        self.simulator.stats.connect()
+
+    def do_GET(self) -> None:
+        self._handle(b"")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self._handle(self.rfile.read(length) if length else b"")
+
+    def _handle(self, body: bytes) -> None:
+        simulator = self.simulator
+        simulator.stats.enter()
+        status = 500
+        try:
+            status, headers, payload = simulator.respond(
+                self.command, self.path, dict(self.headers.items()), body
+            )
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            for chunk in simulator.chunks(payload):
+                self.wfile.write(chunk)
+        finally:
+            simulator.stats.leave(status)
+
+
+class _H2Server:
+    """Minimal HTTP/2 server (prior knowledge, cleartext) for the simulator
+
+    Each connection is read on its own thread and each stream is answered on
+    a separate thread, so concurrent requests are multiplexed over one
+    connection the way an HTTP/2 API gateway would serve them.
+    """
+
+    def __init__(self, simulator: SourceStackSimulator, host: str, port: int):
+        if h2 is None:
+            raise ImportError(
+                "The HTTP/2 simulator requires h2: pip install 'sourcestack[http2]'"
+            )
+        self.simulator = simulator
+        self.socket = socket.create_server((host, port))
+        self.server_port = self.socket.getsockname()[1]
+        self._connections: Set[socket.socket] = set()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        # Closing a listening socket does not wake a blocked accept(), so poll
+        # for shutdown the way socketserver does.
+        self.socket.settimeout(poll_interval)
+        while not self._closed.is_set():
+            try:
+                connection, _ = self.socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            connection.settimeout(None)
+            with self._lock:
+                self._connections.add(connection)
+            self.simulator.stats.connect()
+            threading.Thread(
+                target=self._serve_connection, args=(connection,), daemon=True
+            ).start()
+
+    def shutdown(self) -> None:
+        self._closed.set()
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def server_close(self) -> None:
+        self.socket.close()
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        config = h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        state = h2.connection.H2Connection(config=config)
+        condition = threading.Condition()
+        streams: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+
+        def flush() -> None:
+            if data := state.data_to_send():
+                connection.sendall(data)
+
+        try:
+            with condition:
+                state.initiate_connection()
+                flush()
+            while not self._closed.is_set():
+                data = connection.recv(65536)
+                if not data:
+                    break
+                with condition:
+                    events = state.receive_data(data)
+                    for event in events:
+                        if isinstance(event, h2.events.RequestReceived):
+                            headers = {str(k): str(v) for k, v in event.headers}
+                            streams[event.stream_id] = (headers, bytearray())
+                        elif isinstance(event, h2.events.DataReceived):
+                            streams[event.stream_id][1].extend(event.data)
+                            state.acknowledge_received_data(
+                                event.flow_controlled_length, event.stream_id
+                            )
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers, body = streams.pop(event.stream_id)
+                            threading.Thread(
+                                target=self._respond,
+                                args=(connection, state, condition, event.stream_id),
+                                kwargs={"headers": headers, "body": bytes(body)},
+                                daemon=True,
+                            ).start()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    condition.notify_all()
+                    flush()
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            with condition:
+                condition.notify_all()
+            with self._lock:
+                self._connections.discard(connection)
+            connection.close()
+
+    def _respond(
+        self,
+        connection: socket.socket,
+        state: Any,
+        condition: threading.Condition,
+        stream_id: int,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        simulator = self.simulator
+        simulator.stats.enter()
+        status = 500
+        try:
+            status, response_headers, payload = simulator.respond(
+                headers[":method"], headers[":path"], headers, body
+            )
+            with condition:
+                state.send_headers(
+                    stream_id,
+                    [(":status", str(status))]
+                    + [
+                        (name.lower(), value)
+                        for name, value in response_headers.items()
+                    ],
+                    end_stream=not payload,
+                )
+                connection.sendall(state.data_to_send())
+
+            sent = 0
+            for chunk in simulator.chunks(payload):
+                while chunk:
+                    with condition:
+                        while (
+                            window := min(
+                                state.local_flow_control_window(stream_id),
+                                state.max_outbound_frame_size,
+                            )
+                        ) <= 0:
+                            if self._closed.is_set() or not condition.wait(5):
+                                return
+                        piece, chunk = chunk[:window], chunk[window:]
+                        sent += len(piece)
+                        state.send_data(
+                            stream_id, piece, end_stream=sent == len(payload)
+                        )
+                        connection.sendall(state.data_to_send())
+        except (OSError, h2.exceptions.ProtocolError, h2.exceptions.StreamClosedError):
+            pass
+        finally:
+            simulator.stats.leave(status)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a local SourceStack simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--chunk-delay", type=float, default=0.0)
+    parser.add_argument("--http2", action="store_true")
+    args = parser.parse_args(argv)
+
+    simulator = SourceStackSimulator(
+        job_count=args.jobs,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        chunk_delay=args.chunk_delay,
+        http2=args.http2,
+    )
+    with simulator:
+        print(f"Serving SourceStack simulator on {simulator.url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+import cProfile
+import logging
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ContextManager, Deque, Dict, Iterator, Optional, TextIO
+
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_THRESHOLD = 1.0
+DEFAULT_SLOW_QUERY_RECORDS = 100
+
+_current: ContextVar[Optional["Trace"]] = ContextVar("sourcestack_trace", default=None)
+
+
+class Trace:
+    """Phase timings collected for a single search call"""
+
+    def __init__(self, name: str, fingerprint: str):
+        """
+        Initializes the trace.
+
+        Args:
+            name (str): The traced operation (e.g. search_jobs).
+            fingerprint (str): The query fingerprint (see ``fingerprint``).
+        """
+        self.name = name
+        self.fingerprint = fingerprint
+        self.phases: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, elapsed: float) -> None:
+        """Adds the elapsed seconds to a phase"""
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+
+@dataclass
+class SlowQuery:
+    """A search call that took longer than the slow query threshold"""
+
+    name: str
+    fingerprint: str
+    duration: float
+    phases: Dict[str, float]
+    timestamp: str
+
+
+class SlowQueryLog:
+    """Keeps (and logs) the most recent search calls over a duration threshold"""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_SLOW_QUERY_THRESHOLD,
+        max_records: int = DEFAULT_SLOW_QUERY_RECORDS,
+        log: Optional[logging.Logger] = logger,
+    ):
+        """
+        Initializes the slow query log.
+
+        Args:
+            threshold (float): Seconds after which a call is considered slow.
+            max_records (int): Number of slow queries kept in ``records``.
+            log (logging.Logger): Logger slow queries are written to (None disables logging).
+        """
+        self.threshold = threshold
+        self.log = log
+        self.records: Deque[SlowQuery] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def observe(self, trace: Trace) -> Optional[SlowQuery]:
+        """
+        Records the trace if it exceeded the threshold.
+
+        Args:
+            trace (Trace): A finished trace.
+
+        Returns:
+            Optional[SlowQuery]: The record, if the call was slow.
+        """
+        if trace.duration < self.threshold:
+            return None
+
+        record = SlowQuery(
+            name=trace.name,
+            fingerprint=trace.fingerprint,
+            duration=trace.duration,
+            phases=dict(trace.phases),
+            timestamp=datetime.now().isoformat(),
+        )
+        with self._lock:
+            self.records.append(record)
+        if self.log is not None:
+            self.log.warning(
+                "Slow query %s took %.3fs (%s)",
+                record.fingerprint,
+                record.duration,
+                ", ".join(f"{k}={v:.3f}s" for k, v in record.phases.items()),
+            )
+        return record
+
+
+def fingerprint(name: str, params: Dict[str, Any]) -> str:
+    """
+    Builds a query fingerprint that ignores the searched values.
+
+    Args:
+        name (str): The search operation.
+        params (dict): The search keyword arguments.
+
+    Returns:
+        str: e.g. ``search_jobs_advanced[country:IN](limit)``.
+    """
+    filters = params.get("filters")
+    keys = sorted(key for key in params if key != "filters")
+    shape = ""
+    if isinstance(filters, list):
+        shape = ",".join(
+            f"{condition.get('field')}:{condition.get('operator')}"
+            for condition in filters
+            if isinstance(condition, dict)
+        )
+        shape = f"[{shape}]"
+    return f"{name}{shape}({','.join(keys)})"
+
+
+def current_trace() -> Optional[Trace]:
+    """Returns the trace of the search call running in this context (if any)"""
+    return _current.get()
+
+
+def _otel_span(name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+    if otel_trace is None:
+        return nullcontext()
+    return otel_trace.get_tracer("sourcestack").start_as_current_span(
+        f"sourcestack.{name}", attributes=attributes
+    )
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[None]:
+    """
+    Times a phase of the current search call.
+
+    The phase is added to the current trace and, if OpenTelemetry is
+    installed, exported as a child span.
+
+    Args:
+        name (str): The phase name (e.g. validate, request, download, decode).
+        **attributes: Span attributes (str, bool, int or float values).
+    """
+    trace = _current.get()
+    started = time.perf_counter()
+    try:
+        with _otel_span(name, attributes):
+            yield
+    finally:
+        if trace is not None:
+            trace.record(name, time.perf_counter() - started)
+
+
+@contextmanager
+def traced(
+    name: str,
+    params: Dict[str, Any],
+    slow_query_log: Optional[SlowQueryLog] = None,
+) -> Iterator[Trace]:
+    """
+    Traces a search call, making it the current trace for nested spans.
+
+    Args:
+        name (str): The search operation.
+        params (dict): The search keyword arguments (used for the fingerprint).
+        slow_query_log (SlowQueryLog): Optional log the finished trace is reported to.
+
+    Yields:
+        Trace: The trace collecting phase timings.
+    """
+    trace = Trace(name, fingerprint(name, params))
+    token = _current.set(trace)
+    try:
+        with _otel_span(name, {"sourcestack.fingerprint": trace.fingerprint}):
+            yield trace
+    finally:
+        trace.duration = time.perf_counter() - trace.started
+        _current.reset(token)
+        if slow_query_log is not None:
+            slow_query_log.observe(trace)
+
+
+@contextmanager
+def capture_profile(
+    output: Optional[TextIO] = None,
+    sort: str = "cumulative",
+    limit: int = 30,
+) -> Iterator[cProfile.Profile]:
+    """
+    Profiles the enclosed block with cProfile.
+
+    Args:
+        output (TextIO): Optional stream the sorted stats are printed to afterwards.
+        sort (str): The pstats sort key.
+        limit (int): Number of functions printed.
+
+    Yields:
+        cProfile.Profile: The profiler (e.g. to ``dump_stats`` afterwards).
+    """
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        if output is not None:
+            pstats.Stats(profile, stream=output).sort_stats(sort).print_stats(limit)
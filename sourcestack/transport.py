@@ -0,0 +1,165 @@
+from typing import Any, Iterator, Mapping, Optional
+
+from requests import ConnectionError, PreparedRequest, Response, Timeout
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+
+class _HTTPXBody:
+    """File-like view of an httpx response body used as ``Response.raw``"""
+
+    def __init__(self, response: Any, request: PreparedRequest):
+        self._response = response
+        self._request = request
+        self._iterator: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+
+    def _iter_bytes(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        # Raise the same exceptions as requests' own transport while the
+        # body is read, not just when the request is sent.
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TimeoutException as e:
+            raise Timeout(e, request=self._request) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(e, request=self._request) from e
+
+    def stream(
+        self, chunk_size: int = 65536, decode_content: bool = True
+    ) -> Iterator[bytes]:
+        yield from self._iter_bytes(chunk_size)
+
+    def read(self, amt: Optional[int] = None, **kwargs: Any) -> bytes:
+        if self._iterator is None:
+            self._iterator = self._iter_bytes()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._iterator, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        self._response.close()
+
+    def release_conn(self) -> None:
+        self._response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """Transport adapter that sends requests over HTTP/2 using httpx
+
+    Mounted on a ``requests.Session`` (see ``Client(adapter=...)``), every
+    request made through the session is multiplexed over a small number of
+    HTTP/2 connections instead of needing one HTTP/1.1 connection each.
+    Responses are returned as regular ``requests.Response`` objects, so
+    resources, caching and error handling are unchanged.
+
+    TLS verification, client certificates and proxies are configured on the
+    adapter; the per-request ``verify``, ``cert`` and ``proxies`` are ignored.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        prior_knowledge: bool = False,
+        timeout: Optional[float] = None,
+        verify: Any = True,
+        **kwargs: Any,
+    ):
+        """
+        Initializes the adapter.
+
+        Args:
+            max_connections (int): Maximum number of connections kept open.
+            prior_knowledge (bool): Speak HTTP/2 without negotiation (needed for
+                cleartext http:// servers, which cannot negotiate it).
+            timeout (float): Default timeout in seconds (optional).
+            verify: TLS verification (a bool or a CA bundle path).
+            **kwargs: Additional arguments passed to ``httpx.Client``.
+        """
+        if httpx is None:
+            raise ImportError(
+                "HTTP2Adapter requires httpx with HTTP/2 support: "
+                "pip install 'sourcestack[http2]'"
+            )
+        super().__init__()
+        self.client = httpx.Client(
+            http1=not prior_knowledge,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=timeout,
+            verify=verify,
+            **kwargs,
+        )
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """Sends a prepared request over HTTP/2"""
+        extensions = {}
+        if timeout is not None:
+            connect, read = (
+                timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            )
+            extensions["timeout"] = {
+                "connect": connect,
+                "read": read,
+                "write": read,
+                "pool": connect,
+            }
+
+        outgoing = self.client.build_request(
+            str(request.method),
+            str(request.url),
+            headers=dict(request.headers),
+            content=request.body,
+            extensions=extensions,
+        )
+        try:
+            response = self.client.send(outgoing, stream=True)
+        except httpx.TimeoutException as e:
+            raise Timeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(e, request=request) from e
+
+        return self.build_response(request, response, stream)
+
+    def build_response(
+        self, request: PreparedRequest, incoming: Any, stream: bool
+    ) -> Response:
+        """Wraps an httpx response into a ``requests.Response``"""
+        response = Response()
+        response.status_code = incoming.status_code
+        response.headers = CaseInsensitiveDict(incoming.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = incoming.reason_phrase
+        response.url = str(request.url)
+        response.request = request
+        response.raw = _HTTPXBody(incoming, request)
+        response.connection = self  # type: ignore[assignment]
+        if not stream:
+            response.content  # reads the body before the stream is released
+            incoming.close()
+        return response
+
+    def close(self) -> None:
+        self.client.close()
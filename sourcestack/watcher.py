@@ -0,0 +1,368 @@
+import heapq
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sourcestack.exceptions import SearchError
+from sourcestack.jobs import Job, job_key
+from sourcestack.search import SourceStackSearchService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 3600.0
+
+
+@dataclass
+class SavedSearch:
+    """A query polled by the watcher
+
+    Basic searches are given as ``params`` (the ``search_jobs`` keyword
+    arguments), advanced searches as ``filters``.
+    """
+
+    id: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    filters: Optional[List[Dict[str, Any]]] = None
+    interval: float = DEFAULT_INTERVAL
+    jitter: float = 0.0
+
+
+@dataclass
+class WatchEvent:
+    """The jobs that appeared in or disappeared from a saved search"""
+
+    search: SavedSearch
+    added: List[Job]
+    removed: List[Job]
+    timestamp: str
+
+
+@dataclass
+class _Group:
+    """Saved searches that share a single upstream request"""
+
+    key: str
+    members: Dict[str, SavedSearch] = field(default_factory=dict)
+    seen: Dict[str, Dict[str, Job]] = field(default_factory=dict)
+    generation: int = 0
+    running: bool = False
+
+    @property
+    def interval(self) -> float:
+        return min(member.interval for member in self.members.values())
+
+    @property
+    def jitter(self) -> float:
+        return max(member.jitter for member in self.members.values())
+
+
+def _log_failure(future: "Future[None]") -> None:
+    if (error := future.exception()) is not None:
+        logger.error("Saved search poll failed", exc_info=error)
+
+
+class SearchWatcher:
+    """Polls saved searches on a schedule and emits new and removed jobs
+
+    Saved searches that only differ by ``fields`` are merged into one upstream
+    request, which is polled at the shortest interval among them. Searches
+    with different limits are polled separately, as the limit decides which
+    jobs the API returns.
+    """
+
+    def __init__(
+        self,
+        service: SourceStackSearchService,
+        callback: Optional[Callable[[WatchEvent], None]] = None,
+        events: Optional["queue.Queue[WatchEvent]"] = None,
+        max_workers: int = 4,
+        emit_initial: bool = False,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the watcher
+
+        Args:
+            service: Search service used for the upstream requests
+            callback: Optional callable invoked with each WatchEvent
+            events: Optional queue each WatchEvent is put on
+            max_workers: Number of upstream requests run concurrently
+            emit_initial: Whether the first poll of a search emits its results as added
+            seed: Optional seed for the scheduling jitter
+        """
+        if callback is None and events is None:
+            raise SearchError("Either a callback or an events queue is required")
+
+        self.service = service
+        self.callback = callback
+        self.events = events
+        self.max_workers = max_workers
+        self.emit_initial = emit_initial
+        self._groups: Dict[str, _Group] = {}
+        self._membership: Dict[str, str] = {}
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._sequence = 0
+        self._random = random.Random(seed)
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _query_key(self, search: SavedSearch) -> str:
+        """Canonical upstream query of a saved search (ignoring fields)"""
+        limit = int(search.params["limit"]) if search.params.get("limit") else None
+        if search.filters is not None:
+            return json.dumps(
+                {"filters": search.filters, "limit": limit}, sort_keys=True, default=str
+            )
+
+        self.service._validate_search_params(search.params)
+        params = {
+            key: value
+            for key, value in search.params.items()
+            if key not in ("limit", "fields")
+        }
+        if url := params.get("url"):
+            params["url"] = self.service._process_url(url)
+        return json.dumps(
+            {"params": params, "limit": limit}, sort_keys=True, default=str
+        )
+
+    def _schedule(self, group: _Group, delay: float) -> None:
+        self._sequence += 1
+        heapq.heappush(
+            self._heap,
+            (time.monotonic() + delay, self._sequence, group.key, group.generation),
+        )
+        self._condition.notify_all()
+
+    def add(self, search: SavedSearch) -> None:
+        """
+        Adds (or replaces) a saved search.
+
+        The first poll is spread randomly over the search interval so that
+        searches added together do not all hit the API at once.
+
+        Args:
+            search: The saved search to watch
+        """
+        key = self._query_key(search)
+        with self._condition:
+            if search.id in self._membership:
+                self._remove(search.id)
+
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _Group(key=key)
+                group.members[search.id] = search
+                self._schedule(group, self._random.uniform(0, search.interval))
+            else:
+                previous_interval = group.interval
+                group.members[search.id] = search
+                if group.interval < previous_interval and not group.running:
+                    group.generation += 1
+                    self._schedule(group, self._random.uniform(0, group.interval))
+            self._membership[search.id] = key
+
+    def remove(self, search_id: str) -> None:
+        """
+        Stops watching a saved search.
+
+        Args:
+            search_id: The id of the saved search
+        """
+        with self._condition:
+            self._remove(search_id)
+
+    def _remove(self, search_id: str) -> None:
+        key = self._membership.pop(search_id, None)
+        if key is None:
+            return
+        group = self._groups[key]
+        group.members.pop(search_id, None)
+        group.seen.pop(search_id, None)
+        if not group.members:
+            del self._groups[key]
+
+    def __len__(self) -> int:
+        return len(self._membership)
+
+    def _request(self, group: _Group) -> Dict[str, Any]:
+        """Builds the merged search arguments for a group"""
+        members = list(group.members.values())
+        template = members[0]
+
+        field_sets: List[Optional[Set[str]]] = [
+            (
+                {name.strip() for name in str(m.params["fields"]).split(",")}
+                if m.params.get("fields")
+                else None
+            )
+            for m in members
+        ]
+
+        kwargs: Dict[str, Any]
+        if template.filters is not None:
+            kwargs = {"filters": template.filters}
+        else:
+            kwargs = {
+                key: value
+                for key, value in template.params.items()
+                if key not in ("limit", "fields")
+            }
+        # Members share the same limit (it is part of the query key)
+        if limit := template.params.get("limit"):
+            kwargs["limit"] = limit
+        if all(fields is not None for fields in field_sets):
+            merged: Set[str] = {"post_url"}
+            for fields in field_sets:
+                merged |= fields or set()
+            kwargs["fields"] = ",".join(sorted(merged))
+        return kwargs
+
+    def _fetch(self, group: _Group) -> List[Job]:
+        kwargs = self._request(group)
+        if "filters" in kwargs:
+            results = self.service.search_jobs_advanced(**kwargs)
+        else:
+            results = self.service.search_jobs(**kwargs)
+        return results.get("entries", [])
+
+    def _diff(self, group: _Group, entries: List[Job]) -> List[WatchEvent]:
+        timestamp = datetime.now().isoformat()
+        events = []
+        for search_id, search in list(group.members.items()):
+            current = {job_key(job): job for job in entries}
+
+            if fields := search.params.get("fields"):
+                names = [name.strip() for name in str(fields).split(",")]
+                current = {
+                    key: {name: job[name] for name in names if name in job}
+                    for key, job in current.items()
+                }
+
+            previous = group.seen.get(search_id)
+            group.seen[search_id] = current
+            if previous is None and not self.emit_initial:
+                continue
+
+            previous = previous or {}
+            added = [job for key, job in current.items() if key not in previous]
+            removed = [job for key, job in previous.items() if key not in current]
+            if added or removed:
+                events.append(WatchEvent(search, added, removed, timestamp))
+        return events
+
+    def _emit(self, event: WatchEvent) -> None:
+        # A failing consumer must not stop the other events or the scheduler
+        try:
+            if self.callback is not None:
+                self.callback(event)
+            if self.events is not None:
+                self.events.put(event)
+        except Exception:
+            logger.exception("Saved search event %s not delivered", event.search.id)
+
+    def _reschedule(self, group: _Group, delay: Optional[float] = None) -> bool:
+        """Schedules a group's next poll (the condition must be held)
+
+        Returns:
+            bool: Whether the group is still watched.
+        """
+        group.running = False
+        if self._groups.get(group.key) is not group:
+            return False
+        if delay is None:
+            delay = group.interval + self._random.uniform(0, group.jitter)
+        group.generation += 1
+        self._schedule(group, delay)
+        return True
+
+    def _poll(self, group: _Group) -> None:
+        try:
+            entries = self._fetch(group)
+        except SearchError as e:
+            logger.warning("Saved search poll failed: %s", e)
+            entries = None
+        except BaseException:
+            with self._condition:
+                self._reschedule(group)
+            raise
+
+        with self._condition:
+            if not self._reschedule(group):
+                return
+            events = self._diff(group, entries) if entries is not None else []
+
+        for event in events:
+            self._emit(event)
+
+    def _due(self, now: float) -> List[_Group]:
+        """Pops every group due at ``now`` (the condition must be held)"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key, generation = heapq.heappop(self._heap)
+            group = self._groups.get(key)
+            if group is None or group.generation != generation or group.running:
+                continue
+            group.running = True
+            due.append(group)
+        return due
+
+    def poll(self) -> int:
+        """
+        Runs every saved search that is due, synchronously.
+
+        Returns:
+            int: The number of upstream requests made.
+        """
+        with self._condition:
+            due = self._due(time.monotonic())
+        pending = list(due)
+        try:
+            while pending:
+                self._poll(pending.pop(0))
+        finally:
+            # Groups not reached (the poll raised) stay due for the next call
+            with self._condition:
+                for group in pending:
+                    self._reschedule(group, delay=0)
+        return len(due)
+
+    def run(self) -> None:
+        """Runs the scheduler until ``stop`` is called"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while not self._stopped.is_set():
+                with self._condition:
+                    due = self._due(time.monotonic())
+                    if not due:
+                        timeout = (
+                            self._heap[0][0] - time.monotonic() if self._heap else None
+                        )
+                        self._condition.wait(timeout)
+                        continue
+                for group in due:
+                    executor.submit(self._poll, group).add_done_callback(_log_failure)
+
+    def start(self) -> "SearchWatcher":
+        """Runs the scheduler in a background thread"""
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="sourcestack-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the scheduler and waits for in-flight polls to finish"""
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
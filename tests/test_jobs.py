@@ -1,7 +1,11 @@
+import io
+import json
+
 import pytest
 import responses
-from requests import Session
+from requests import HTTPError, Session
 
+from sourcestack.cache import ResponseCache
 from sourcestack.jobs import Jobs
 
 
@@ -78,3 +82,136 @@ def test_jobs_by_uses_category(jobs: Jobs):
     )
 
     assert jobs.by_uses_category(uses_category="Fake", exact=False) == MOCK_JSON
+
+
+@responses.activate
+def test_jobs_cache_serves_fresh_entries():
+    cache = ResponseCache(ttl=60)
+    jobs = Jobs(base_url="https://api.sourcestack.co", session=Session(), cache=cache)
+    responses.add(
+        responses.GET,
+        "https://api.sourcestack.co/jobs?parent=Fake",
+        json=MOCK_JSON,
+        status=200,
+    )
+
+    assert jobs.by_parent(parent="Fake") == MOCK_JSON
+    assert jobs.by_parent(parent="Fake") == MOCK_JSON
+    assert len(responses.calls) == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+
+
+@responses.activate
+def test_jobs_cache_returns_copies():
+    cache = ResponseCache(ttl=60)
+    jobs = Jobs(base_url="https://api.sourcestack.co", session=Session(), cache=cache)
+    responses.add(
+        responses.GET,
+        "https://api.sourcestack.co/jobs?parent=Fake",
+        json=MOCK_JSON,
+        status=200,
+    )
+
+    jobs.by_parent(parent="Fake")["data"].clear()
+    cached = jobs.by_parent(parent="Fake")
+    cached["data"].clear()
+    assert jobs.by_parent(parent="Fake") == MOCK_JSON
+    assert cache.stats.hits == 2
+
+
+@responses.activate
+def test_jobs_cache_revalidates_with_validators():
+    cache = ResponseCache(ttl=0)
+    jobs = Jobs(base_url="https://api.sourcestack.co", session=Session(), cache=cache)
+    responses.add(
+        responses.GET,
+        "https://api.sourcestack.co/jobs?parent=Fake",
+        json=MOCK_JSON,
+        status=200,
+        headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+    responses.add(
+        responses.GET,
+        "https://api.sourcestack.co/jobs?parent=Fake",
+        status=304,
+    )
+
+    assert jobs.by_parent(parent="Fake") == MOCK_JSON
+    assert jobs.by_parent(parent="Fake") == MOCK_JSON
+
+    headers = responses.calls[1].request.headers
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert cache.stats.revalidations == 1
+    assert cache.stats.not_modified == 1
+    assert cache.stats.bytes_saved == cache.stats.bytes_downloaded > 0
+
+
+@responses.activate
+def test_jobs_cache_replaces_changed_entries():
+    cache = ResponseCache(ttl=0)
+    jobs = Jobs(base_url="https://api.sourcestack.co", session=Session(), cache=cache)
+    updated = {"data": [{"id": 3, "name": "Job #3"}]}
+    responses.add(
+        responses.POST,
+        "https://api.sourcestack.co/jobs",
+        json=MOCK_JSON,
+        status=200,
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(
+        responses.POST,
+        "https://api.sourcestack.co/jobs",
+        json=updated,
+        status=200,
+        headers={"ETag": '"v2"'},
+    )
+
+    filters = [{"field": "country", "operator": "EQUALS", "value": "Canada"}]
+    assert jobs.search_advanced(filters=filters) == MOCK_JSON
+    assert jobs.search_advanced(filters=filters) == updated
+    assert cache.stats.not_modified == 0
+    assert len(cache) == 1
+
+
+@responses.activate
+def test_jobs_raw(jobs: Jobs):
+    responses.add(
+        responses.GET,
+        "https://api.sourcestack.co/jobs?name=Fake&exact=false",
+        body=b'{"data": []}',
+        status=200,
+    )
+
+    assert jobs.raw(name="Fake", exact="false") == b'{"data": []}'
+
+
+@responses.activate
+def test_jobs_raw_stream(jobs: Jobs):
+    responses.add(
+        responses.POST,
+        "https://api.sourcestack.co/jobs?limit=2",
+        json=MOCK_JSON,
+        status=200,
+    )
+
+    stream = io.BytesIO()
+    filters = [{"field": "country", "operator": "EQUALS", "value": "Canada"}]
+    written = jobs.raw(filters=filters, stream=stream, chunk_size=8, limit=2)
+
+    assert written == len(stream.getvalue())
+    assert json.loads(stream.getvalue()) == MOCK_JSON
+    assert json.loads(responses.calls[0].request.body) == {"filters": filters}
+
+
+@responses.activate
+def test_jobs_raw_raises_on_http_errors(jobs: Jobs):
+    responses.add(
+        responses.GET,
+        "https://api.sourcestack.co/jobs?parent=Fake",
+        status=500,
+    )
+
+    with pytest.raises(HTTPError):
+        jobs.raw(parent="Fake")
@@ -0,0 +1,100 @@
+import pytest
+import responses
+from requests import HTTPError
+
+from sourcestack.cache import ResponseCache
+from sourcestack.pool import ApiKey, KeyPoolSession, PooledClient
+from sourcestack.search import SourceStackSearchService
+
+URL = "https://api.sourcestack.co/jobs?parent=Fake"
+MOCK_JSON = {"data": [{"post_url": "https://fake.com/1", "company_name": "Fake"}]}
+
+
+def keys_used():
+    return [call.request.headers["X-API-KEY"] for call in responses.calls]
+
+
+def test_pool_requires_keys():
+    with pytest.raises(ValueError):
+        KeyPoolSession([])
+
+
+@responses.activate
+def test_pool_spreads_requests_over_keys():
+    responses.add(responses.GET, URL, json=MOCK_JSON, status=200)
+    client = PooledClient(["key-1", "key-2"], base_url="https://api.sourcestack.co")
+
+    for _ in range(4):
+        client.jobs.by_parent("Fake")
+
+    assert keys_used() == ["key-1", "key-2", "key-1", "key-2"]
+    assert client.api_key == "key-1"
+
+
+@responses.activate
+def test_pool_prefers_key_with_most_capacity():
+    responses.add(responses.GET, URL, json=MOCK_JSON, status=200)
+    client = PooledClient(
+        [ApiKey("small", rate=0.01, burst=1), ApiKey("large", rate=0.01, burst=3)],
+        base_url="https://api.sourcestack.co",
+    )
+
+    for _ in range(4):
+        client.jobs.by_parent("Fake")
+
+    assert sorted(keys_used()) == ["large", "large", "large", "small"]
+
+
+@responses.activate
+def test_pool_cools_down_throttled_keys():
+    responses.add(responses.GET, URL, status=429, headers={"Retry-After": "120"})
+    responses.add(responses.GET, URL, json=MOCK_JSON, status=200)
+    client = PooledClient(["key-1", "key-2"], base_url="https://api.sourcestack.co")
+
+    assert client.jobs.by_parent("Fake") == MOCK_JSON
+    assert client.jobs.by_parent("Fake") == MOCK_JSON
+
+    assert keys_used() == ["key-1", "key-2", "key-2"]
+    assert client.pool.keys[0].throttled == 1
+
+
+@responses.activate
+def test_pool_surfaces_errors_when_every_key_fails():
+    responses.add(responses.GET, URL, status=401)
+    client = PooledClient(["key-1", "key-2"], base_url="https://api.sourcestack.co")
+
+    with pytest.raises(HTTPError):
+        client.jobs.by_parent("Fake")
+
+    assert keys_used() == ["key-1", "key-2"]
+    assert [key.unauthorized for key in client.pool.keys] == [1, 1]
+
+
+@responses.activate
+def test_search_service_with_pooled_client():
+    responses.add(responses.GET, URL, json=MOCK_JSON, status=200)
+    client = PooledClient(["key-1", "key-2"], base_url="https://api.sourcestack.co")
+    service = SourceStackSearchService(client=client)
+
+    results = service.search_jobs(parent="Fake")
+
+    assert results["status"] == "success"
+    assert service.client is client
+
+
+@responses.activate
+def test_search_service_cache_with_pooled_client():
+    responses.add(responses.GET, URL, json=MOCK_JSON, status=200)
+    cache = ResponseCache(ttl=60)
+    client = PooledClient(["key-1", "key-2"], base_url="https://api.sourcestack.co")
+    service = SourceStackSearchService(client=client, cache=cache)
+
+    service.search_jobs(parent="Fake")
+    service.search_jobs(parent="Fake")
+
+    assert client.cache is None
+    assert cache.stats.hits == 1
+    assert len(responses.calls) == 1
+
+    SourceStackSearchService(client=client).search_jobs(parent="Fake")
+    assert len(responses.calls) == 2
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from sourcestack.client import Client
+from sourcestack.scheduler import (
+    BATCH,
+    INTERACTIVE,
+    PriorityClass,
+    RequestScheduler,
+    priority,
+)
+from sourcestack.simulator import SourceStackSimulator
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_scheduler_rejects_unknown_classes():
+    scheduler = RequestScheduler()
+    with pytest.raises(ValueError):
+        with scheduler.slot("unknown"):
+            pass
+
+
+def test_scheduler_uses_context_priority():
+    scheduler = RequestScheduler()
+    with scheduler.slot() as cls:
+        assert cls.name == INTERACTIVE
+    with priority(BATCH), scheduler.slot() as cls:
+        assert cls.name == BATCH
+
+
+def test_scheduler_shares_slots_by_weight():
+    scheduler = RequestScheduler(
+        max_in_flight=1,
+        classes=[PriorityClass(INTERACTIVE, weight=4), PriorityClass(BATCH, weight=1)],
+    )
+    order = []
+    lock = threading.Lock()
+
+    def request(name):
+        with scheduler.slot(name):
+            with lock:
+                order.append(name)
+
+    threads = []
+    with scheduler.slot(INTERACTIVE):
+        for name in [BATCH] * 5 + [INTERACTIVE] * 5:
+            cls = scheduler.classes[name]
+            waiting = cls.waiting
+            thread = threading.Thread(target=request, args=(name,))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda: cls.waiting == waiting + 1)
+    for thread in threads:
+        thread.join()
+
+    assert order[:5].count(INTERACTIVE) == 4
+    assert sorted(order) == sorted([BATCH] * 5 + [INTERACTIVE] * 5)
+
+
+def test_scheduler_caps_class_in_flight():
+    scheduler = RequestScheduler(max_in_flight=3)
+    batch = scheduler.classes[BATCH]
+    batch.max_in_flight = 1
+    released = threading.Event()
+
+    def hold():
+        with scheduler.slot(BATCH):
+            released.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    wait_until(lambda: batch.in_flight == 1)
+    waiter = threading.Thread(target=hold)
+    waiter.start()
+    wait_until(lambda: batch.waiting == 1)
+
+    with scheduler.slot(INTERACTIVE):
+        assert batch.in_flight == 1
+        assert batch.waiting == 1
+
+    released.set()
+    holder.join()
+    waiter.join()
+    assert batch.dispatched == 2
+
+
+def test_client_requests_go_through_scheduler():
+    scheduler = RequestScheduler(max_in_flight=2)
+    with SourceStackSimulator(job_count=100) as sim:
+        client = Client(api_key="fake-api-key", base_url=sim.url, scheduler=scheduler)
+        client.jobs.by_parent("Spotify")
+        with priority(BATCH):
+            client.jobs.raw(parent="Spotify")
+
+    assert scheduler.classes[INTERACTIVE].dispatched == 1
+    assert scheduler.classes[BATCH].dispatched == 1
+    assert scheduler.in_flight == 0
@@ -276,3 +276,28 @@ class TestAdvancedSearchResults:
             limit=limit,
         )
         assert len(results["entries"]) <= limit
+
+
+class TestRawSearch:
+    def test_search_jobs_raw_params(self, mock_search_service):
+        service, _ = mock_search_service
+        with patch.object(service.client.jobs, "raw") as mock_raw:
+            mock_raw.return_value = b'{"data": []}'
+            assert service.search_jobs_raw(uses_product="Docker") == b'{"data": []}'
+            mock_raw.assert_called_once_with(
+                stream=None, uses_product="Docker", exact="true"
+            )
+
+    def test_search_jobs_advanced_raw_params(self, mock_search_service):
+        service, _ = mock_search_service
+        filters = [{"field": "country", "operator": "EQUALS", "value": "Canada"}]
+        with patch.object(service.client.jobs, "raw") as mock_raw:
+            service.search_jobs_advanced_raw(filters=filters, limit=2)
+            mock_raw.assert_called_once_with(filters=filters, stream=None, limit=2)
+
+    def test_search_jobs_raw_wraps_errors(self, mock_search_service):
+        service, _ = mock_search_service
+        with patch.object(service.client.jobs, "raw") as mock_raw:
+            mock_raw.side_effect = Exception("500 Server Error")
+            with pytest.raises(SearchError, match="Search failed"):
+                service.search_jobs_raw(name="DevOps")
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sourcestack.exceptions import SearchError
+from sourcestack.search import SourceStackSearchService
+from sourcestack.sharding import (
+    DateRangeDimension,
+    InListDimension,
+    ShardDimension,
+    dimensions_for,
+    search_sharded,
+)
+from sourcestack.simulator import SourceStackSimulator
+
+FILTERS = [
+    {"field": "country", "operator": "IN", "value": "United States,Canada,Germany"},
+    {"field": "last_indexed", "operator": "GREATER_THAN", "value": "LAST_90D"},
+]
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    with SourceStackSimulator(job_count=1000) as sim:
+        yield sim
+
+
+@pytest.fixture
+def service(simulator):
+    return SourceStackSearchService(api_key="fake-api-key", base_url=simulator.url)
+
+
+def test_in_list_dimension_partitions_values():
+    shards = InListDimension("country").split(
+        [{"field": "country", "operator": "IN", "value": ["A", "B", "C"]}]
+    )
+    assert shards == [
+        [{"field": "country", "operator": "IN", "value": ["A"]}],
+        [{"field": "country", "operator": "IN", "value": ["B", "C"]}],
+    ]
+    assert InListDimension("country").split(shards[0]) is None
+
+
+def test_date_range_dimension_bisects_range():
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    dimension = DateRangeDimension(
+        "last_indexed", start=start, end=start + timedelta(days=2)
+    )
+    first, second = dimension.split([])
+    assert first[1]["value"] > second[0]["value"]
+    assert first[0]["value"] == start.isoformat()
+    assert second[1]["value"] == (start + timedelta(days=2)).isoformat()
+
+    narrow = DateRangeDimension("last_indexed", start=start, end=start)
+    assert narrow.split([]) is None
+
+
+def test_dimensions_for_filters():
+    dimensions = dimensions_for(FILTERS)
+    assert [type(d) for d in dimensions] == [InListDimension, DateRangeDimension]
+
+
+def test_dimensions_for_ignores_numeric_values():
+    filters = [{"field": "hours", "operator": "GREATER_THAN", "value": 20240101}]
+    assert dimensions_for(filters) == []
+
+
+def test_search_sharded_marks_unsplittable_shards_truncated():
+    result = search_sharded(
+        lambda filters: ([{"post_url": "a"}, {"post_url": "b"}], None),
+        [{"field": "country", "operator": "EQUALS", "value": "Canada"}],
+        limit=2,
+        dimensions=[],
+    )
+    assert result.shards == 1
+    assert result.truncated
+    assert len(result.entries) == 2
+
+
+def test_sharded_search_returns_every_match(simulator, service):
+    expected = {job["post_url"] for job in simulator.search_advanced(FILTERS)}
+
+    results = service.search_jobs_advanced(filters=FILTERS, limit=50, shard=True)
+
+    assert len(expected) > 50
+    assert results["status"] == "success"
+    assert results["shards"] > 1
+    assert not results["truncated"]
+    assert results["count"] == len(expected)
+    assert {job["post_url"] for job in results["entries"]} == expected
+
+
+def test_sharded_search_splits_results_capped_by_the_api(simulator, service):
+    expected = {job["post_url"] for job in simulator.search_advanced(FILTERS)}
+    simulator.max_limit = 40
+    try:
+        results = service.search_jobs_advanced(filters=FILTERS, limit=50, shard=True)
+    finally:
+        simulator.max_limit = None
+
+    assert results["shards"] > 1
+    assert not results["truncated"]
+    assert {job["post_url"] for job in results["entries"]} == expected
+
+
+@pytest.mark.parametrize("fields", ["job_name,country", "job_name, country"])
+def test_sharded_search_keeps_requested_fields(service, fields):
+    results = service.search_jobs_advanced(
+        filters=FILTERS, limit=50, fields=fields, shard=True
+    )
+    assert all(set(job) == {"job_name", "country"} for job in results["entries"])
+
+
+def test_sharded_search_requires_limit(service):
+    with pytest.raises(SearchError, match="requires a limit"):
+        service.search_jobs_advanced(filters=FILTERS, shard=True)
+
+
+def test_shard_dimension_requires_split():
+    class Incomplete(ShardDimension):
+        field = "country"
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
@@ -0,0 +1,181 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import HTTPError, Timeout
+
+from sourcestack.cache import ResponseCache
+from sourcestack.client import Client
+from sourcestack.pool import PooledClient
+from sourcestack.search import SourceStackSearchService
+from sourcestack.simulator import SourceStackSimulator, fixed, matches_filter
+
+
+@pytest.fixture(scope="module", params=["http/1.1", "h2"])
+def simulator(request):
+    if request.param == "h2":
+        pytest.importorskip("h2")
+        pytest.importorskip("httpx")
+    with SourceStackSimulator(
+        job_count=500, api_key="fake-api-key", http2=request.param == "h2"
+    ) as sim:
+        yield sim
+
+
+@pytest.fixture(scope="module")
+def adapter(simulator):
+    if not simulator.http2:
+        yield None
+        return
+    from sourcestack.transport import HTTP2Adapter
+
+    adapter = HTTP2Adapter(prior_knowledge=True)
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture
+def client(simulator, adapter) -> Client:
+    return Client(api_key="fake-api-key", base_url=simulator.url, adapter=adapter)
+
+
+def test_simulator_by_name(client: Client):
+    results = client.jobs.by_name("Engineer", limit=10)
+    assert 0 < len(results["data"]) <= 10
+    assert all("engineer" in job["job_name"].lower() for job in results["data"])
+
+
+def test_simulator_by_uses_product_exact(client: Client):
+    results = client.jobs.by_uses_product("Docker", exact=True, fields="tags_matched")
+    assert results["data"]
+    assert all(set(job) == {"tags_matched"} for job in results["data"])
+    assert all("Docker" in job["tags_matched"] for job in results["data"])
+
+
+def test_simulator_search_advanced(client: Client):
+    results = client.jobs.search_advanced(
+        filters=[
+            {"field": "country", "operator": "IN", "value": "Canada,Germany"},
+            {"field": "last_indexed", "operator": "GREATER_THAN", "value": "LAST_30D"},
+        ],
+        limit=20,
+    )
+    assert results["data"]
+    assert all(job["country"] in ("Canada", "Germany") for job in results["data"])
+
+
+def test_simulator_search_service(client: Client):
+    service = SourceStackSearchService(client=client)
+    results = service.search_jobs(parent="Spotify", limit=5)
+    assert results["status"] == "success"
+    assert results["count"] == 5
+
+
+def test_simulator_injected_failures(simulator, client: Client):
+    simulator.fail_next(429)
+    with pytest.raises(HTTPError) as error:
+        client.jobs.by_parent("Canva")
+    assert error.value.response.status_code == 429
+    assert error.value.response.headers["Retry-After"] == "1"
+
+
+def test_simulator_rejects_unknown_api_key(simulator, adapter):
+    client = Client(api_key="wrong", base_url=simulator.url, adapter=adapter)
+    with pytest.raises(HTTPError):
+        client.jobs.by_parent("Canva")
+
+
+def test_simulator_revalidation(simulator, adapter):
+    cache = ResponseCache(ttl=0)
+    client = Client(
+        api_key="fake-api-key", base_url=simulator.url, cache=cache, adapter=adapter
+    )
+    first = client.jobs.by_parent("Stripe", limit=3)
+    expected = json.loads(json.dumps(first))
+    first["data"].clear()
+    second = client.jobs.by_parent("Stripe", limit=3)
+    assert second == expected
+    assert cache.stats.not_modified == 1
+
+
+def test_simulator_raw_stream(client: Client):
+    body = client.jobs.raw(name="Engineer", limit=5)
+    stream = io.BytesIO()
+    assert client.jobs.raw(name="Engineer", limit=5, stream=stream) == len(body)
+    assert stream.getvalue() == body
+
+
+def test_http2_multiplexes_one_connection():
+    pytest.importorskip("h2")
+    transport = pytest.importorskip("sourcestack.transport")
+    pytest.importorskip("httpx")
+
+    with SourceStackSimulator(
+        job_count=100, api_key="fake-api-key", latency=fixed(0.2), http2=True
+    ) as sim:
+        adapter = transport.HTTP2Adapter(prior_knowledge=True, max_connections=1)
+        client = Client(api_key="fake-api-key", base_url=sim.url, adapter=adapter)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: client.jobs.by_name("Engineer"), range(8))
+            )
+        adapter.close()
+
+    assert all(result["data"] for result in results)
+    assert sim.stats.connections == 1
+    assert sim.stats.max_in_flight > 1
+
+
+def test_simulator_pooled_client(simulator, adapter):
+    client = PooledClient(
+        ["wrong", "fake-api-key"], base_url=simulator.url, adapter=adapter
+    )
+    assert client.jobs.by_parent("Stripe", limit=3)["data"]
+    assert client.pool.keys[0].unauthorized == 1
+
+
+def test_http2_body_timeouts_raise_requests_errors():
+    pytest.importorskip("h2")
+    transport = pytest.importorskip("sourcestack.transport")
+    pytest.importorskip("httpx")
+
+    with SourceStackSimulator(
+        job_count=100,
+        api_key="fake-api-key",
+        chunk_size=256,
+        chunk_delay=1.0,
+        http2=True,
+    ) as sim:
+        adapter = transport.HTTP2Adapter(prior_knowledge=True, timeout=0.2)
+        client = Client(api_key="fake-api-key", base_url=sim.url, adapter=adapter)
+        with pytest.raises(Timeout):
+            client.jobs.by_name("Engineer")
+        with pytest.raises(Timeout):
+            client.jobs.raw(name="Engineer", stream=io.BytesIO())
+        adapter.close()
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        ({"field": "job_name", "operator": "CONTAINS_ANY", "value": "Senior"}, True),
+        (
+            {"field": "job_name", "operator": "CONTAINS_ALL", "value": "Data Lead"},
+            False,
+        ),
+        ({"field": "tags_matched", "operator": "CONTAINS_ALL", "value": ["AWS"]}, True),
+        ({"field": "remote", "operator": "EQUALS", "value": "true"}, True),
+        ({"field": "country", "operator": "NOT_IN", "value": "Canada"}, True),
+        ({"field": "hours", "operator": "LESS_THAN", "value": 30}, False),
+    ],
+)
+def test_matches_filter(condition, expected):
+    job = {
+        "job_name": "Senior Data Engineer",
+        "tags_matched": ["AWS", "Python"],
+        "remote": True,
+        "country": "Germany",
+        "hours": 40,
+    }
+    assert matches_filter(job, condition) is expected
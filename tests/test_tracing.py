@@ -0,0 +1,82 @@
+import io
+
+import pytest
+
+from sourcestack.search import SourceStackSearchService
+from sourcestack.simulator import SourceStackSimulator, fixed
+from sourcestack.tracing import (
+    SlowQueryLog,
+    capture_profile,
+    current_trace,
+    fingerprint,
+    span,
+    traced,
+)
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    with SourceStackSimulator(job_count=200, latency=fixed(0.02)) as sim:
+        yield sim
+
+
+def test_fingerprint_ignores_values():
+    assert fingerprint("search_jobs", {"name": "DevOps", "limit": 2}) == (
+        "search_jobs(limit,name)"
+    )
+    assert fingerprint(
+        "search_jobs_advanced",
+        {"filters": [{"field": "country", "operator": "IN", "value": "Canada"}]},
+    ) == ("search_jobs_advanced[country:IN]()")
+
+
+def test_spans_record_into_current_trace():
+    assert current_trace() is None
+    with traced("search_jobs", {"name": "DevOps"}) as trace:
+        assert current_trace() is trace
+        with span("validate"):
+            pass
+        with span("validate"):
+            pass
+    assert current_trace() is None
+    assert set(trace.phases) == {"validate"}
+    assert trace.duration >= trace.phases["validate"]
+
+
+def test_span_without_trace_is_a_noop():
+    with span("validate"):
+        pass
+
+
+def test_slow_query_log_records_phases(simulator):
+    log = SlowQueryLog(threshold=0.01, log=None)
+    service = SourceStackSearchService(
+        api_key="fake-api-key", base_url=simulator.url, slow_query_log=log
+    )
+    service.search_jobs(url="https://www.spotify.com", limit=5)
+
+    record = log.records[-1]
+    assert record.fingerprint == "search_jobs(limit,url)"
+    assert record.duration >= 0.02
+    assert {"validate", "process_url", "request", "download", "decode", "format"} <= (
+        set(record.phases)
+    )
+
+
+def test_slow_query_log_skips_fast_queries(simulator):
+    log = SlowQueryLog(threshold=60, log=None)
+    service = SourceStackSearchService(
+        api_key="fake-api-key", base_url=simulator.url, slow_query_log=log
+    )
+    service.search_jobs_advanced(
+        filters=[{"field": "country", "operator": "EQUALS", "value": "Canada"}]
+    )
+    assert not log.records
+
+
+def test_capture_profile(simulator):
+    service = SourceStackSearchService(api_key="fake-api-key", base_url=simulator.url)
+    output = io.StringIO()
+    with capture_profile(output=output, limit=5):
+        service.search_jobs(parent="Canva")
+    assert "function calls" in output.getvalue()
@@ -0,0 +1,175 @@
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from sourcestack.exceptions import SearchError
+from sourcestack.search import SourceStackSearchService
+from sourcestack.simulator import SourceStackSimulator
+from sourcestack.watcher import SavedSearch, SearchWatcher, WatchEvent
+
+
+@pytest.fixture
+def service():
+    with patch("sourcestack.search.Client"):
+        yield SourceStackSearchService(api_key="test_key", base_url="test_url")
+
+
+def entries(*ids):
+    return {"entries": [{"post_url": f"https://fake.com/{i}"} for i in ids]}
+
+
+def test_watcher_requires_a_sink(service):
+    with pytest.raises(SearchError):
+        SearchWatcher(service)
+
+
+def test_watcher_merges_overlapping_searches(service):
+    watcher = SearchWatcher(service, callback=lambda event: None)
+    watcher.add(
+        SavedSearch(
+            id="a",
+            params={"parent": "Spotify", "limit": 10, "fields": "job_name"},
+            interval=0,
+        )
+    )
+    watcher.add(
+        SavedSearch(
+            id="b",
+            params={"parent": "Spotify", "limit": 10, "fields": "country"},
+            interval=0,
+        )
+    )
+    watcher.add(SavedSearch(id="c", params={"parent": "Canva"}, interval=0))
+
+    with patch.object(service, "search_jobs", return_value=entries(1)) as search:
+        assert watcher.poll() == 2
+
+    search.assert_any_call(
+        parent="Spotify", limit=10, fields="country,job_name,post_url"
+    )
+    search.assert_any_call(parent="Canva")
+
+
+def test_watcher_keeps_searches_with_different_limits_apart(service):
+    watcher = SearchWatcher(service, callback=lambda event: None)
+    watcher.add(
+        SavedSearch(id="a", params={"parent": "Spotify", "limit": 5}, interval=0)
+    )
+    watcher.add(
+        SavedSearch(id="b", params={"parent": "Spotify", "limit": 10}, interval=0)
+    )
+    watcher.add(SavedSearch(id="c", params={"parent": "Spotify"}, interval=0))
+
+    with patch.object(service, "search_jobs", return_value=entries(1)) as search:
+        assert watcher.poll() == 3
+
+    search.assert_any_call(parent="Spotify", limit=5)
+    search.assert_any_call(parent="Spotify", limit=10)
+    search.assert_any_call(parent="Spotify")
+
+
+def test_watcher_limit_above_server_default():
+    events: "queue.Queue[WatchEvent]" = queue.Queue()
+    with SourceStackSimulator(job_count=2000, default_limit=100) as sim:
+        service = SourceStackSearchService(api_key="fake-api-key", base_url=sim.url)
+        watcher = SearchWatcher(service, events=events, emit_initial=True)
+        watcher.add(
+            SavedSearch(
+                id="large", params={"name": "Engineer", "limit": 300}, interval=0
+            )
+        )
+        watcher.add(SavedSearch(id="default", params={"name": "Engineer"}, interval=0))
+        assert watcher.poll() == 2
+
+    added = {}
+    while not events.empty():
+        event = events.get_nowait()
+        added[event.search.id] = len(event.added)
+    assert added == {"large": 300, "default": 100}
+
+
+def test_watcher_emits_added_and_removed_jobs(service):
+    events: "queue.Queue[WatchEvent]" = queue.Queue()
+    watcher = SearchWatcher(service, events=events)
+    watcher.add(SavedSearch(id="docker", params={"uses_product": "Docker"}, interval=0))
+
+    with patch.object(
+        service, "search_jobs", side_effect=[entries(1, 2), entries(2, 3)]
+    ):
+        watcher.poll()
+        assert events.empty()
+        watcher.poll()
+
+    event = events.get_nowait()
+    assert event.search.id == "docker"
+    assert event.added == [{"post_url": "https://fake.com/3"}]
+    assert event.removed == [{"post_url": "https://fake.com/1"}]
+
+
+def test_watcher_survives_failing_callback(service):
+    calls = []
+
+    def callback(event):
+        calls.append(event.search.id)
+        raise RuntimeError("consumer failed")
+
+    watcher = SearchWatcher(service, callback=callback, emit_initial=True)
+    watcher.add(SavedSearch(id="a", params={"parent": "Spotify"}, interval=0))
+    watcher.add(SavedSearch(id="b", params={"parent": "Canva"}, interval=0))
+
+    with patch.object(service, "search_jobs", side_effect=lambda **kwargs: entries(1)):
+        assert watcher.poll() == 2
+        assert sorted(calls) == ["a", "b"]
+        assert not any(group.running for group in watcher._groups.values())
+        assert watcher.poll() == 2
+
+
+def test_watcher_reschedules_groups_after_errors(service):
+    watcher = SearchWatcher(service, callback=lambda event: None)
+    watcher.add(SavedSearch(id="a", params={"parent": "Spotify"}, interval=0))
+    watcher.add(SavedSearch(id="b", params={"parent": "Canva"}, interval=0))
+
+    with patch.object(service, "search_jobs", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            watcher.poll()
+    assert not any(group.running for group in watcher._groups.values())
+
+    with patch.object(service, "search_jobs", return_value=entries(1)) as search:
+        assert watcher.poll() == 2
+    assert search.call_count == 2
+
+
+def test_watcher_remove(service):
+    watcher = SearchWatcher(service, callback=lambda event: None)
+    watcher.add(SavedSearch(id="a", params={"parent": "Spotify"}, interval=0))
+    watcher.remove("a")
+
+    assert len(watcher) == 0
+    with patch.object(service, "search_jobs") as search:
+        assert watcher.poll() == 0
+    search.assert_not_called()
+
+
+def test_watcher_runs_against_simulator():
+    events: "queue.Queue[WatchEvent]" = queue.Queue()
+    with SourceStackSimulator(job_count=200) as sim:
+        service = SourceStackSearchService(api_key="fake-api-key", base_url=sim.url)
+        watcher = SearchWatcher(service, events=events, emit_initial=True)
+        watcher.add(
+            SavedSearch(id="stripe", params={"parent": "Stripe"}, interval=0.05)
+        )
+        watcher.add(
+            SavedSearch(
+                id="canada",
+                filters=[{"field": "country", "operator": "EQUALS", "value": "Canada"}],
+                interval=0.05,
+            )
+        )
+        watcher.start()
+        try:
+            received = {events.get(timeout=5).search.id for _ in range(2)}
+        finally:
+            watcher.stop()
+
+    assert received == {"stripe", "canada"}